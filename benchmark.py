@@ -0,0 +1,297 @@
+import argparse
+import json
+import platform
+import random
+import statistics
+import sys
+import time
+from genetic_algorithm import Chromosome, GeneticAlgorithm
+from permutation_algorithm import PermutationChromosome, PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+SEED = 12345
+# Tolerância padrão: uma métrica 10% pior que a da linha de base é considerada regressão
+DEFAULT_THRESHOLD = 0.10
+# Métricas de tempo até a solução variam mais entre execuções e têm tolerância maior
+TIME_TO_SOLUTION_THRESHOLD = 0.25
+# Tempo mínimo, em segundos, de cada medida dos microbenchmarks
+MIN_MEASURE_TIME = 0.05
+# Gerações cronometradas em cada medida de evolve_population, sempre a partir de um algoritmo novo
+EVOLVE_GENERATIONS = 20
+
+def metric(value, unit, better, threshold=None):
+    """
+    Monta o registro de uma métrica.
+
+    Args:
+        value: Valor medido.
+        unit: Unidade do valor.
+        better: "lower" se valores menores são melhores, "higher" caso contrário.
+        threshold: Tolerância relativa desta métrica (padrão: a tolerância da comparação).
+    """
+    record = {"value": value, "unit": unit, "better": better}
+    if threshold is not None:
+        record["threshold"] = threshold
+    return record
+
+def time_per_call(func, repeat=5):
+    """
+    Mede o tempo por chamada de uma função, calibrando o número de chamadas para que cada
+    medida dure pelo menos MIN_MEASURE_TIME, e retorna a melhor de repeat medidas.
+
+    Returns:
+        Tempo por chamada, em segundos.
+    """
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_MEASURE_TIME:
+            break
+        number *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / number
+
+def time_per_fresh_call(factory, calls, repeat=5):
+    """
+    Mede o tempo por chamada de uma função que altera o próprio estado, como evolve_population.
+
+    Cada medida usa uma função nova, criada por factory fora da parte cronometrada, e faz
+    sempre o mesmo número de chamadas, então todas as medidas repetem exatamente o mesmo trabalho.
+
+    Args:
+        factory: Função sem argumentos que retorna a função a medir.
+        calls: Número de chamadas de cada medida.
+        repeat: Número de medidas.
+
+    Returns:
+        Tempo por chamada da melhor medida, em segundos.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        func = factory()
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+    return best / calls
+
+def _algorithm(algorithm, N, population_size, **options):
+    return algorithm(N, population_size=population_size, progress=SilentProgress(), seed=SEED, **options)
+
+def micro_benchmarks(quick=False):
+    """
+    Microbenchmarks de cada operador, em microssegundos por chamada.
+
+    Returns:
+        Dicionário nome -> métrica.
+    """
+    results = {}
+    repeat = 3 if quick else 5
+
+    for N in (8, 64):
+        random.seed(SEED)
+        genes = [random.randrange(N) for _ in range(N)]
+        chromosome = Chromosome(genes, N)
+        results[f"micro.calculate_fitness.N{N}"] = chromosome.calculate_fitness
+        results[f"micro.set_gene.N{N}"] = lambda c=chromosome, N=N: c.set_gene(random.randrange(N), random.randrange(N))
+
+    N = 1000
+    random.seed(SEED)
+    permutation = list(range(N))
+    random.shuffle(permutation)
+    chromosome = PermutationChromosome(permutation, N)
+    results[f"micro.permutation_calculate_fitness.N{N}"] = chromosome.calculate_fitness
+    results[f"micro.swap.N{N}"] = lambda c=chromosome: c.swap(random.randrange(N), random.randrange(N))
+
+    ga = _algorithm(GeneticAlgorithm, 8, 200)
+    ga.prepare_selection()
+    parent1, parent2 = ga.population[0], ga.population[1]
+    child = parent1.copy()
+    results["micro.prepare_selection.P200"] = ga.prepare_selection
+    results["micro.roulette_selection_batch.P200"] = lambda: ga.roulette_selection_batch(200)
+    results["micro.tournament_selection_batch.P200"] = lambda: ga.tournament_selection_batch(200)
+    results["micro.crossover.N8"] = lambda p1=parent1, p2=parent2, c=child: ga.crossover(p1, p2, c)
+    results["micro.mutate.N8"] = lambda c=child: ga.mutate(c)
+
+    permutation_ga = _algorithm(PermutationGeneticAlgorithm, 1000, 20)
+    parent1, parent2 = permutation_ga.population[0], permutation_ga.population[1]
+    child = parent1.copy()
+    results["micro.permutation_crossover.N1000"] = lambda p1=parent1, p2=parent2, c=child: permutation_ga.crossover(p1, p2, c)
+
+    measured = {}
+    for name, func in results.items():
+        random.seed(SEED)
+        measured[name] = metric(time_per_call(func, repeat) * 1e6, "us", "lower")
+    # evolve_population muda o estado do algoritmo (inclusive a taxa de mutação adaptada),
+    # então cada medida parte de um algoritmo novo com a mesma semente
+    evolve = time_per_fresh_call(lambda: _algorithm(GeneticAlgorithm, 8, 200).evolve_population, EVOLVE_GENERATIONS, repeat)
+    measured["micro.evolve_population.N8.P200"] = metric(evolve * 1e6, "us", "lower")
+    return measured
+
+def throughput_benchmarks(quick=False):
+    """
+    Gerações por segundo de evolve_population para vários tamanhos de população e de tabuleiro,
+    pela melhor de várias execuções com a mesma semente.
+
+    Returns:
+        Dicionário nome -> métrica.
+    """
+    generations = 10 if quick else 30
+    repeat = 3 if quick else 5
+    cases = [(GeneticAlgorithm, "classic", N, P) for N in (8, 32) for P in (50, 200, 800)]
+    cases += [(PermutationGeneticAlgorithm, "permutation", N, P) for N in (100, 1000) for P in (20, 100)]
+    results = {}
+    for algorithm, kind, N, population_size in cases:
+        # Com a mesma semente todas as repetições fazem o mesmo trabalho; a mais rápida é a
+        # menos afetada por outras cargas da máquina
+        best = float("inf")
+        for _ in range(repeat):
+            ga = _algorithm(algorithm, N, population_size, generations=generations)
+            start = time.perf_counter()
+            for _ in range(generations):
+                ga.evolve_population()
+            best = min(best, time.perf_counter() - start)
+        results[f"throughput.{kind}.N{N}.P{population_size}"] = metric(generations / best, "generations/s", "higher")
+    return results
+
+def time_to_solution_benchmarks(quick=False):
+    """
+    Distribuição do tempo e das gerações até a solução sobre várias sementes.
+
+    Returns:
+        Dicionário nome -> métrica.
+    """
+    seeds = 10 if quick else 40
+    cases = [
+        ("classic.N8", GeneticAlgorithm, dict(N=8, population_size=125, generations=125, crossover_prob=0.7)),
+        ("permutation.N64", PermutationGeneticAlgorithm, dict(N=64, population_size=20, generations=500)),
+        ("memetic.N200", PermutationGeneticAlgorithm, dict(N=200, population_size=10, generations=100, local_search_elites=True)),
+    ]
+    results = {}
+    for name, algorithm, params in cases:
+        times = []
+        generations = []
+        solved = 0
+        for seed in range(seeds):
+            ga = algorithm(progress=SilentProgress(), seed=seed, **params)
+            start = time.perf_counter()
+            best = ga.run()
+            times.append(time.perf_counter() - start)
+            generations.append(ga.generation)
+            solved += best.conflicts == 0
+        times.sort()
+        prefix = f"time_to_solution.{name}"
+        results[f"{prefix}.success_rate"] = metric(solved / seeds, "fraction", "higher", TIME_TO_SOLUTION_THRESHOLD)
+        results[f"{prefix}.median_time"] = metric(statistics.median(times), "s", "lower", TIME_TO_SOLUTION_THRESHOLD)
+        results[f"{prefix}.p90_time"] = metric(times[int(0.9 * (seeds - 1))], "s", "lower", TIME_TO_SOLUTION_THRESHOLD)
+        results[f"{prefix}.median_generations"] = metric(statistics.median(generations), "generations", "lower", TIME_TO_SOLUTION_THRESHOLD)
+    return results
+
+SUITES = {
+    "micro": micro_benchmarks,
+    "throughput": throughput_benchmarks,
+    "tts": time_to_solution_benchmarks,
+}
+
+def run_suites(names=tuple(SUITES), quick=False):
+    """
+    Executa os conjuntos de benchmarks escolhidos.
+
+    Args:
+        names: Nomes dos conjuntos (ver SUITES).
+        quick: Se True, usa menos repetições, gerações e sementes.
+
+    Returns:
+        Dicionário com os metadados da máquina e as métricas.
+    """
+    metrics = {}
+    for name in names:
+        metrics.update(SUITES[name](quick))
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "system": platform.system(),
+            "seed": SEED,
+            "quick": quick,
+        },
+        "metrics": metrics,
+    }
+
+def compare(results, baseline, threshold=DEFAULT_THRESHOLD):
+    """
+    Compara as métricas com uma linha de base.
+
+    Args:
+        results: Dicionário retornado por run_suites.
+        baseline: Resultado anterior de run_suites.
+        threshold: Tolerância relativa para métricas sem tolerância própria.
+
+    Returns:
+        Lista de dicionários, um por métrica presente nos dois resultados, com a variação
+        relativa (positiva quando a métrica melhorou) e a flag "regression".
+    """
+    comparison = []
+    for name, current in results["metrics"].items():
+        previous = baseline["metrics"].get(name)
+        if previous is None or not previous["value"]:
+            continue
+        change = (current["value"] - previous["value"]) / abs(previous["value"])
+        if current["better"] == "lower":
+            change = -change
+        tolerance = current.get("threshold", threshold)
+        comparison.append({
+            "metric": name,
+            "baseline": previous["value"],
+            "current": current["value"],
+            "unit": current["unit"],
+            "change": change,
+            "regression": change < -tolerance,
+        })
+    return comparison
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmarks reprodutíveis do Algoritmo Genético, com comparação contra uma linha de base.")
+    parser.add_argument("--suites", nargs="+", choices=list(SUITES), default=list(SUITES), help="Conjuntos de benchmarks a executar.")
+    parser.add_argument("--quick", action="store_true", help="Menos repetições, gerações e sementes.")
+    parser.add_argument("-o", "--output", default=None, help="Arquivo JSON onde os resultados são gravados.")
+    parser.add_argument("-b", "--baseline", default=None, help="Arquivo JSON de uma execução anterior para comparação.")
+    parser.add_argument("-t", "--threshold", type=float, default=DEFAULT_THRESHOLD, help="Piora relativa tolerada antes de acusar regressão.")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    results = run_suites(args.suites, args.quick)
+
+    if args.output:
+        with open(args.output, "w") as output_file:
+            json.dump(results, output_file, indent=2)
+
+    if not args.baseline:
+        for name, record in results["metrics"].items():
+            print(f"{name}: {record['value']:.4g} {record['unit']}")
+        return
+
+    with open(args.baseline) as baseline_file:
+        baseline = json.load(baseline_file)
+    comparison = compare(results, baseline, args.threshold)
+    for entry in comparison:
+        flag = "REGRESSÃO" if entry["regression"] else "ok"
+        print(f"{entry['metric']}: {entry['baseline']:.4g} -> {entry['current']:.4g} {entry['unit']} "
+              f"({entry['change']:+.1%}) {flag}")
+    regressions = sum(entry["regression"] for entry in comparison)
+    if regressions:
+        print(f"{regressions} regressões acima da tolerância.")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
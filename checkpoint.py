@@ -0,0 +1,146 @@
+import os
+import struct
+from array import array
+from genetic_algorithm import GeneticAlgorithm
+from permutation_algorithm import PermutationGeneticAlgorithm
+
+MAGIC = b"NQGA"
+VERSION = 1
+
+# Cabeçalho de tamanho fixo, seguido das seções em ordem:
+#   genes da população (população x rainhas, no tipo do array de genes),
+#   conflitos da população ("Q"), genes do melhor cromossomo,
+#   histórico de conflitos ("Q") e estado do gerador aleatório (625 x "I").
+# Como cada seção tem tamanho derivável do cabeçalho, o arquivo pode ser lido via mmap.
+HEADER = struct.Struct(
+    "<4sH"    # magic, versão
+    "BBc"     # tipo do algoritmo, método de crossover, código de tipo dos genes
+    "QQQQQ"   # N, rainhas, tamanho da população, gerações, elite
+    "QQQ"     # geração atual, gerações sem melhora, conflitos do melhor cromossomo
+    "dd"      # probabilidade de mutação (já adaptada), probabilidade de crossover
+    "QQ"      # tamanho do histórico, tamanho máximo do histórico (0 = ilimitado)
+    "QBd"     # versão do gerador aleatório, flag e valor de gauss_next
+    "Q"       # reinícios parciais realizados
+    "Bq"      # flag e valor da semente da execução
+)
+
+KINDS = {GeneticAlgorithm: 0, PermutationGeneticAlgorithm: 1}
+CROSSOVER_METHODS = ("ox", "pmx")
+RNG_STATE_WORDS = 625
+
+def save_checkpoint(ga, path):
+    """
+    Salva o estado completo do algoritmo, incluindo o gerador aleatório da instância (ga.rng),
+    em um arquivo binário compacto.
+
+    A escrita é feita em um arquivo temporário e depois renomeada, então um checkpoint
+    anterior nunca fica corrompido por uma escrita interrompida.
+
+    Args:
+        ga: Instância de GeneticAlgorithm ou PermutationGeneticAlgorithm.
+        path: Caminho do arquivo de checkpoint.
+    """
+    kind = KINDS[type(ga)]
+    crossover_method = CROSSOVER_METHODS.index(getattr(ga, "crossover_method", "ox"))
+    typecode = ga.best_chromosome.genes.typecode
+    rng_version, rng_key, gauss_next = ga.rng.getstate()
+    history = ga.conflicts_history
+    history_maxlen = getattr(history, "maxlen", None) or 0
+    # Sementes fora do intervalo de 64 bits não são guardadas (o estado do gerador basta para retomar)
+    has_seed = ga.seed is not None and -(1 << 63) <= ga.seed < 1 << 63
+
+    header = HEADER.pack(
+        MAGIC, VERSION,
+        kind, crossover_method, typecode.encode(),
+        ga.N, ga.queens, len(ga.population), ga.generations, ga.elite_size,
+        ga.generation, ga.no_improvement, ga.best_chromosome.conflicts,
+        ga.mutation_prob, ga.crossover_prob,
+        len(history), history_maxlen,
+        rng_version, gauss_next is not None, gauss_next or 0.0,
+        ga.restarts,
+        has_seed, ga.seed if has_seed else 0,
+    )
+
+    temporary_path = f"{path}.tmp"
+    with open(temporary_path, "wb") as checkpoint_file:
+        checkpoint_file.write(header)
+        for chromosome in ga.population:
+            checkpoint_file.write(chromosome.genes.tobytes())
+        checkpoint_file.write(array("Q", (c.conflicts for c in ga.population)).tobytes())
+        checkpoint_file.write(ga.best_chromosome.genes.tobytes())
+        checkpoint_file.write(array("Q", history).tobytes())
+        checkpoint_file.write(array("I", rng_key).tobytes())
+    os.replace(temporary_path, path)
+
+def load_checkpoint(path, **options):
+    """
+    Restaura um algoritmo a partir de um checkpoint, incluindo o estado do seu gerador aleatório.
+
+    Chamar run() no algoritmo restaurado continua a execução exatamente de onde parou.
+
+    Args:
+        path: Caminho do arquivo de checkpoint.
+        **options: Opções extras repassadas ao construtor (por exemplo, progress,
+            profile ou fitness_cache_size), que não fazem parte do estado salvo.
+
+    Returns:
+        Instância restaurada de GeneticAlgorithm ou PermutationGeneticAlgorithm.
+    """
+    with open(path, "rb") as checkpoint_file:
+        data = memoryview(checkpoint_file.read())
+
+    (magic, version, kind, crossover_method, typecode,
+     N, queens, population_size, generations, elite_size,
+     generation, no_improvement, best_conflicts,
+     mutation_prob, crossover_prob,
+     history_length, history_maxlen,
+     rng_version, has_gauss, gauss_next,
+     restarts,
+     has_seed, seed) = HEADER.unpack_from(data, 0)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"Arquivo de checkpoint inválido: {path}")
+    typecode = typecode.decode()
+    offset = HEADER.size
+
+    def read_array(code, count):
+        nonlocal offset
+        values = array(code)
+        size = values.itemsize * count
+        values.frombytes(data[offset:offset + size])
+        offset += size
+        return values
+
+    all_genes = [read_array(typecode, queens) for _ in range(population_size)]
+    conflicts = read_array("Q", population_size)
+    best_genes = read_array(typecode, queens)
+    history = read_array("Q", history_length)
+    rng_key = read_array("I", RNG_STATE_WORDS)
+
+    algorithm = PermutationGeneticAlgorithm if kind == KINDS[PermutationGeneticAlgorithm] else GeneticAlgorithm
+    chromosome_class = algorithm.chromosome_class
+    # Os conflitos salvos evitam reavaliar a população; os contadores são montados quando necessários
+    population = [chromosome_class(genes, N, conflicts=c) for genes, c in zip(all_genes, conflicts)]
+    params = dict(
+        N=N,
+        population_size=population_size,
+        mutation_prob=mutation_prob,
+        crossover_prob=crossover_prob,
+        generations=generations,
+        elite_size=elite_size,
+        history_size=history_maxlen or None,
+        population=population,
+    )
+    if algorithm is PermutationGeneticAlgorithm:
+        params["crossover_method"] = CROSSOVER_METHODS[crossover_method]
+    else:
+        params["queens"] = queens
+    ga = algorithm(**params, **options)
+
+    ga.best_chromosome = chromosome_class(best_genes, N, conflicts=best_conflicts)
+    ga.no_improvement = no_improvement
+    ga.generation = generation
+    ga.restarts = restarts
+    ga.seed = seed if has_seed else None
+    ga.conflicts_history.extend(history)
+    ga.rng.setstate((rng_version, tuple(rng_key), gauss_next if has_gauss else None))
+    return ga
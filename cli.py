@@ -0,0 +1,223 @@
+import argparse
+import csv
+import json
+import random
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from checkpoint import load_checkpoint
+from exact_solver import SolutionIndex
+from genetic_algorithm import GeneticAlgorithm
+from permutation_algorithm import PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+# Índice de soluções exatas, compartilhado entre as execuções do mesmo processo
+SOLUTION_INDEX = SolutionIndex()
+
+CSV_FIELDS = ["run", "seed", "N", "genes", "conflicts", "generations", "wall_time"]
+# Limite de gerações de uma execução nova quando nenhum é informado
+DEFAULT_GENERATIONS = 125
+
+def run_instance(N, population_size=125, mutation_prob=0.05, crossover_prob=0.7, generations=None, elite_size=5, seed=None, run=0, permutation=False, profile=False,
+                 checkpoint_path=None, checkpoint_interval=30.0, resume=None, exact=False,
+                 local_search_rate=0.0, local_search_elites=False, local_search_budget=1000, max_time=None,
+                 reject_duplicates=False, restart_after=None, restart_fraction=0.5):
+    """
+    Executa uma instância do Algoritmo Genético sem interface gráfica.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+        population_size: Número de cromossomos na população.
+        mutation_prob: Probabilidade de mutação de um cromossomo.
+        crossover_prob: Probabilidade de realizar crossover entre dois pais.
+        generations: Número máximo de gerações a serem executadas (padrão: DEFAULT_GENERATIONS).
+        elite_size: Número de melhores cromossomos preservados em cada geração.
+        seed: Semente do gerador aleatório (None para uma execução não reprodutível).
+        run: Índice da execução, repassado ao registro.
+        permutation: Se True, posiciona N rainhas com codificação por permutação.
+        profile: Se True, inclui no registro o tempo gasto em cada fase do algoritmo.
+        checkpoint_path: Se definido, o estado é salvo nesse arquivo periodicamente.
+        checkpoint_interval: Intervalo mínimo, em segundos, entre dois checkpoints.
+        resume: Caminho de um checkpoint a partir do qual a execução é retomada. Os parâmetros
+            do algoritmo, a semente e o estado aleatório vêm do checkpoint; generations, se
+            informado, passa a ser o novo limite total de gerações.
+        exact: Se True, sorteia a solução no índice do solucionador exato em vez de executar o algoritmo.
+        local_search_rate: Fração dos filhos melhorada por busca local a cada geração (0 desativa).
+        local_search_elites: Se True, os elites também passam pela busca local.
+        local_search_budget: Número máximo de passos de busca local por geração.
+        max_time: Tempo máximo, em segundos, da execução do algoritmo (None para não limitar).
+        reject_duplicates: Se True, filhos repetidos sofrem mutações forçadas antes de serem aceitos.
+        restart_after: Se definido, gerações sem melhora antes de um reinício parcial da população.
+        restart_fraction: Fração da população substituída em cada reinício parcial.
+
+    Returns:
+        Dicionário com os genes, conflitos, gerações e tempo de execução.
+    """
+    start = time.perf_counter()
+    if exact:
+        queens = N if permutation else 8
+        genes = SOLUTION_INDEX.random_solution(queens, N, random.Random(seed))
+        return {
+            "run": run,
+            "seed": seed,
+            "N": N,
+            "genes": list(genes),
+            "conflicts": 0,
+            "generations": 0,
+            "wall_time": round(time.perf_counter() - start, 6),
+            "stop_reason": "solved",
+            "restarts": 0,
+        }
+    # Opções que não fazem parte do estado salvo no checkpoint
+    options = dict(
+        local_search_rate=local_search_rate,
+        local_search_elites=local_search_elites,
+        local_search_budget=local_search_budget,
+        reject_duplicates=reject_duplicates,
+        restart_after=restart_after,
+        restart_fraction=restart_fraction,
+    )
+    if resume:
+        ga = load_checkpoint(resume, profile=profile, progress=SilentProgress(), **options)
+        if generations is not None:
+            ga.generations = generations
+        N = ga.N
+        seed = ga.seed
+    else:
+        algorithm = PermutationGeneticAlgorithm if permutation else GeneticAlgorithm
+        ga = algorithm(
+            N=N,
+            population_size=population_size,
+            mutation_prob=mutation_prob,
+            crossover_prob=crossover_prob,
+            generations=DEFAULT_GENERATIONS if generations is None else generations,
+            elite_size=elite_size,
+            profile=profile,
+            seed=seed,
+            # O progresso por geração é descartado no modo sem interface
+            progress=SilentProgress(),
+            **options
+        )
+    best_solution = ga.run(checkpoint_path=checkpoint_path, checkpoint_interval=checkpoint_interval, max_time=max_time)
+    wall_time = time.perf_counter() - start
+
+    record = {
+        "run": run,
+        "seed": seed,
+        "N": N,
+        "genes": list(best_solution.genes),
+        "conflicts": best_solution.conflicts,
+        "generations": ga.generation,
+        "wall_time": round(wall_time, 6),
+        "stop_reason": ga.stop_reason,
+        "restarts": ga.restarts,
+    }
+    if profile:
+        record["profile"] = ga.stats.summary()
+    return record
+
+def _run_instance_kwargs(kwargs):
+    return run_instance(**kwargs)
+
+def write_record(record, output, fmt, writer=None):
+    """
+    Escreve um registro de execução no formato escolhido.
+
+    Args:
+        record: Dicionário retornado por run_instance.
+        output: Arquivo de saída aberto para escrita.
+        fmt: "json" (uma linha JSON por execução) ou "csv".
+        writer: csv.DictWriter já configurado, usado quando fmt é "csv".
+    """
+    if fmt == "json":
+        output.write(json.dumps(record, separators=(",", ":")) + "\n")
+    else:
+        writer.writerow(dict(record, genes=" ".join(map(str, record["genes"]))))
+    output.flush()
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Algoritmo Genético para o Problema das 8-Rainhas em Tabuleiro N x N, sem interface gráfica.")
+    parser.add_argument("-n", "--board-size", type=int, default=8, help="Tamanho do tabuleiro NxN (mínimo 8).")
+    parser.add_argument("-p", "--population-size", type=int, default=125, help="Número de indivíduos na população inicial.")
+    parser.add_argument("-m", "--mutation-prob", type=float, default=0.05, help="Chance de alterar genes durante a mutação.")
+    parser.add_argument("-c", "--crossover-prob", type=float, default=0.7, help="Chance de combinar genes entre pais.")
+    parser.add_argument("-g", "--generations", type=int, default=None,
+                        help=f"Máximo de iterações do algoritmo (padrão: {DEFAULT_GENERATIONS}; com --resume, o limite salvo no checkpoint).")
+    parser.add_argument("-e", "--elite-size", type=int, default=5, help="Número de melhores indivíduos preservados a cada geração.")
+    parser.add_argument("--max-time", type=float, default=None, help="Tempo máximo, em segundos, de cada execução.")
+    parser.add_argument("--permutation", action="store_true", help="Posiciona N rainhas no tabuleiro NxN com codificação por permutação.")
+    parser.add_argument("--local-search-rate", type=float, default=0.0, help="Fração dos filhos melhorada por busca local (min-conflicts) a cada geração.")
+    parser.add_argument("--local-search-elites", action="store_true", help="Aplica a busca local também aos elites.")
+    parser.add_argument("--local-search-budget", type=int, default=1000, help="Máximo de passos de busca local por geração.")
+    parser.add_argument("--reject-duplicates", action="store_true", help="Perturba filhos idênticos a outros cromossomos da nova população.")
+    parser.add_argument("--restart-after", type=int, default=None, help="Gerações sem melhora antes de renovar parte da população.")
+    parser.add_argument("--restart-fraction", type=float, default=0.5, help="Fração da população renovada em cada reinício parcial.")
+    parser.add_argument("--profile", action="store_true", help="Inclui o tempo por fase em cada registro (apenas no formato JSON).")
+    parser.add_argument("--checkpoint", default=None, help="Arquivo de checkpoint ('{run}' é substituído pelo índice da execução).")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0, help="Segundos entre checkpoints.")
+    parser.add_argument("--resume", default=None, help="Retoma uma execução a partir de um arquivo de checkpoint.")
+    parser.add_argument("--exact", action="store_true", help="Usa o solucionador exato (índice de soluções) em vez do algoritmo.")
+    parser.add_argument("-r", "--runs", type=int, default=1, help="Número de execuções independentes.")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Semente base; a execução i usa seed + i.")
+    parser.add_argument("-w", "--workers", type=int, default=1, help="Número de processos para execuções em paralelo.")
+    parser.add_argument("-f", "--format", choices=["json", "csv"], default="json", help="Formato dos registros de saída.")
+    parser.add_argument("-o", "--output", default="-", help="Arquivo de saída ('-' para a saída padrão).")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.board_size < 8:
+        parser.error("O tamanho do tabuleiro deve ser pelo menos 8.")
+    if args.runs < 1 or args.workers < 1:
+        parser.error("O número de execuções e de processos deve ser pelo menos 1.")
+    if args.resume and args.runs != 1:
+        parser.error("--resume retoma uma única execução.")
+
+    jobs = [
+        dict(
+            N=args.board_size,
+            population_size=args.population_size,
+            mutation_prob=args.mutation_prob,
+            crossover_prob=args.crossover_prob,
+            generations=args.generations,
+            elite_size=args.elite_size,
+            seed=None if args.seed is None else args.seed + run,
+            run=run,
+            permutation=args.permutation,
+            profile=args.profile,
+            checkpoint_path=args.checkpoint.format(run=run) if args.checkpoint else None,
+            checkpoint_interval=args.checkpoint_interval,
+            resume=args.resume,
+            exact=args.exact,
+            local_search_rate=args.local_search_rate,
+            local_search_elites=args.local_search_elites,
+            local_search_budget=args.local_search_budget,
+            max_time=args.max_time,
+            reject_duplicates=args.reject_duplicates,
+            restart_after=args.restart_after,
+            restart_fraction=args.restart_fraction,
+        )
+        for run in range(args.runs)
+    ]
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        writer = None
+        if args.format == "csv":
+            writer = csv.DictWriter(output, fieldnames=CSV_FIELDS, extrasaction="ignore")
+            writer.writeheader()
+
+        if args.workers == 1:
+            for job in jobs:
+                write_record(run_instance(**job), output, args.format, writer)
+        else:
+            with ProcessPoolExecutor(max_workers=args.workers) as executor:
+                for record in executor.map(_run_instance_kwargs, jobs):
+                    write_record(record, output, args.format, writer)
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+import math
+from collections import Counter
+from fitness_cache import genotype_key
+
+class DiversityStats:
+    __slots__ = ("unique", "population_size", "entropy")
+
+    def __init__(self, unique, population_size, entropy):
+        """
+        Medidas de diversidade de uma população.
+
+        Args:
+            unique: Número de genótipos distintos.
+            population_size: Tamanho da população.
+            entropy: Entropia média por gene, normalizada entre 0 (todos os cromossomos iguais
+                naquele gene) e 1 (valores distribuídos o mais uniformemente possível).
+        """
+        self.unique = unique
+        self.population_size = population_size
+        self.entropy = entropy
+
+    @property
+    def unique_ratio(self):
+        """
+        Fração da população formada por genótipos distintos.
+        """
+        return self.unique / self.population_size if self.population_size else 0.0
+
+    def as_dict(self):
+        return {"unique": self.unique, "unique_ratio": self.unique_ratio, "entropy": self.entropy}
+
+def unique_genotypes(population):
+    """
+    Conta os genótipos distintos de uma população pelo hash dos genes.
+
+    Args:
+        population: Lista de cromossomos.
+
+    Returns:
+        Número de genótipos distintos.
+    """
+    return len({genotype_key(chromosome.genes) for chromosome in population})
+
+def gene_entropy(population, N):
+    """
+    Calcula a entropia de Shannon de cada gene (a coluna escolhida para cada linha) e retorna a média.
+
+    A entropia de cada gene é dividida pela maior possível para a população e o tabuleiro,
+    log(min(tamanho da população, N)), para ficar entre 0 e 1.
+
+    Args:
+        population: Lista de cromossomos.
+        N: Tamanho do tabuleiro (N x N).
+
+    Returns:
+        Entropia média normalizada, entre 0 e 1.
+    """
+    size = len(population)
+    max_entropy = math.log(min(size, N)) if size > 1 and N > 1 else 0.0
+    if not max_entropy:
+        return 0.0
+    total = 0.0
+    genes = 0
+    for values in zip(*(chromosome.genes for chromosome in population)):
+        counts = Counter(values)
+        if len(counts) > 1:
+            total -= sum(count / size * math.log(count / size) for count in counts.values())
+        genes += 1
+    return total / (genes * max_entropy) if genes else 0.0
+
+def population_diversity(population, N):
+    """
+    Mede a diversidade de uma população.
+
+    Args:
+        population: Lista de cromossomos.
+        N: Tamanho do tabuleiro (N x N).
+
+    Returns:
+        Objeto DiversityStats.
+    """
+    return DiversityStats(unique_genotypes(population), len(population), gene_entropy(population, N))
@@ -0,0 +1,496 @@
+import argparse
+import json
+import os
+import random
+import statistics
+import struct
+import time
+from array import array
+from genetic_algorithm import gene_typecode
+
+# Maior tabuleiro para o qual o índice de soluções é montado (acima disso, só a busca direta)
+MAX_EXACT_N = 15
+# Número máximo de soluções guardadas por índice; acima disso o índice fica incompleto
+MAX_INDEXED_SOLUTIONS = 100_000
+DEFAULT_INDEX_DIRECTORY = os.path.join(os.path.expanduser("~"), ".nqueens", "solutions")
+
+MAGIC = b"NQEX"
+VERSION = 1
+# Cabeçalho do arquivo de índice, seguido dos genes de todas as soluções guardadas, em sequência
+HEADER = struct.Struct(
+    "<4sH"  # magic, versão
+    "cQQ"   # código de tipo dos genes, rainhas, N
+    "QB"    # soluções guardadas, flag de índice completo
+)
+
+def _check_size(N, queens):
+    queens = N if queens is None else queens
+    if not 1 <= queens <= N:
+        raise ValueError("O número de rainhas deve estar entre 1 e N.")
+    return queens
+
+def iter_solutions(N, queens=None):
+    """
+    Enumera, em ordem lexicográfica, todas as posições válidas das rainhas por
+    backtracking com máscaras de bits (uma rainha por linha, a partir da linha 0).
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+        queens: Número de rainhas (padrão: N).
+
+    Yields:
+        Tupla com a coluna da rainha de cada linha.
+    """
+    queens = _check_size(N, queens)
+    full = (1 << N) - 1
+    genes = [0] * queens
+    # Colunas e diagonais ocupadas ao chegar em cada linha, como máscaras de bits
+    columns = [0] * queens
+    left = [0] * queens
+    right = [0] * queens
+    available = [0] * queens
+    available[0] = full
+    row = 0
+    while row >= 0:
+        free = available[row]
+        if not free:
+            row -= 1
+            continue
+        bit = free & -free
+        available[row] = free ^ bit
+        genes[row] = bit.bit_length() - 1
+        if row + 1 == queens:
+            yield tuple(genes)
+            continue
+        next_columns = columns[row] | bit
+        next_left = ((left[row] | bit) << 1) & full
+        next_right = (right[row] | bit) >> 1
+        row += 1
+        columns[row] = next_columns
+        left[row] = next_left
+        right[row] = next_right
+        available[row] = full & ~(next_columns | next_left | next_right)
+
+def _count(full, columns, left, right, rows_left):
+    free = full & ~(columns | left | right)
+    if rows_left == 1:
+        return bin(free).count("1")
+    total = 0
+    while free:
+        bit = free & -free
+        free ^= bit
+        total += _count(full, columns | bit, ((left | bit) << 1) & full, (right | bit) >> 1, rows_left - 1)
+    return total
+
+def count_solutions(N, queens=None):
+    """
+    Conta as posições válidas das rainhas sem gerá-las.
+
+    A simetria do espelhamento horizontal reduz a busca à metade: só a primeira metade
+    das colunas da primeira linha é explorada, e o resultado é dobrado.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+        queens: Número de rainhas (padrão: N).
+
+    Returns:
+        Número de soluções.
+    """
+    queens = _check_size(N, queens)
+    if queens == 1:
+        return N
+    full = (1 << N) - 1
+    total = 0
+    for col in range(N // 2):
+        bit = 1 << col
+        total += _count(full, bit, (bit << 1) & full, bit >> 1, queens - 1)
+    total *= 2
+    if N % 2:
+        bit = 1 << (N // 2)
+        total += _count(full, bit, (bit << 1) & full, bit >> 1, queens - 1)
+    return total
+
+def first_solution(N, queens=None):
+    """
+    Returns:
+        A primeira solução em ordem lexicográfica (tupla de colunas) ou None se não houver.
+    """
+    return next(iter_solutions(N, queens), None)
+
+def constructive_solution(N, queens=None):
+    """
+    Monta uma solução pela construção explícita clássica (colunas pares e depois ímpares,
+    com ajustes quando N % 6 é 2 ou 3), em tempo linear e sem busca.
+
+    Com menos rainhas que N, usa as primeiras linhas da solução de N rainhas.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N), pelo menos 4.
+        queens: Número de rainhas (padrão: N).
+
+    Returns:
+        Tupla com a coluna da rainha de cada linha.
+    """
+    queens = _check_size(N, queens)
+    if N < 4:
+        raise ValueError("A construção explícita exige um tabuleiro de pelo menos 4 x 4.")
+    # Colunas numeradas a partir de 1, como na formulação original
+    evens = list(range(2, N + 1, 2))
+    odds = list(range(1, N + 1, 2))
+    if N % 6 == 2:
+        odds = [3, 1] + odds[3:] + [5]
+    elif N % 6 == 3:
+        evens = evens[1:] + [2]
+        odds = odds[2:] + [1, 3]
+    return tuple(col - 1 for col in (evens + odds)[:queens])
+
+def symmetric_solution(solution, rng=random):
+    """
+    Aplica ao tabuleiro uma das 8 simetrias do quadrado (rotações e reflexões), sorteada.
+
+    Args:
+        solution: Solução com N rainhas em um tabuleiro N x N (permutação de 0 a N - 1).
+        rng: Gerador aleatório (módulo random ou instância de random.Random).
+
+    Returns:
+        Tupla com a solução transformada, também válida.
+    """
+    N = len(solution)
+    genes = list(solution)
+    if rng.random() < 0.5:
+        # Transposição: a rainha da linha r na coluna c passa para a linha c na coluna r
+        transposed = [0] * N
+        for row, col in enumerate(genes):
+            transposed[col] = row
+        genes = transposed
+    if rng.random() < 0.5:
+        genes.reverse()
+    if rng.random() < 0.5:
+        genes = [N - 1 - col for col in genes]
+    return tuple(genes)
+
+def random_solution(N, queens=None, rng=random):
+    """
+    Encontra uma solução por backtracking visitando as colunas livres em ordem aleatória.
+
+    A solução é válida, mas não é sorteada uniformemente entre todas as soluções
+    (para isso, use SolutionIndex.random_solution com um índice completo). Acima de
+    MAX_EXACT_N, onde a busca fica cara demais, a solução é uma simetria sorteada de
+    constructive_solution.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+        queens: Número de rainhas (padrão: N).
+        rng: Gerador aleatório (módulo random ou instância de random.Random).
+
+    Returns:
+        Tupla com a coluna da rainha de cada linha, ou None se não houver solução.
+    """
+    queens = _check_size(N, queens)
+    if N > MAX_EXACT_N:
+        return symmetric_solution(constructive_solution(N), rng)[:queens]
+    full = (1 << N) - 1
+    genes = [0] * queens
+    masks = [(0, 0, 0)] * queens
+    candidates = [None] * queens
+    row = 0
+    while row >= 0:
+        columns, left, right = masks[row]
+        if candidates[row] is None:
+            free = full & ~(columns | left | right)
+            order = [col for col in range(N) if free >> col & 1]
+            rng.shuffle(order)
+            candidates[row] = order
+        if not candidates[row]:
+            candidates[row] = None
+            row -= 1
+            continue
+        col = candidates[row].pop()
+        genes[row] = col
+        if row + 1 == queens:
+            return tuple(genes)
+        bit = 1 << col
+        row += 1
+        masks[row] = (columns | bit, ((left | bit) << 1) & full, (right | bit) >> 1)
+    return None
+
+def is_valid_solution(genes, N):
+    """
+    Verifica se os genes posicionam as rainhas sem nenhum conflito.
+
+    Args:
+        genes: Sequência com a coluna da rainha de cada linha.
+        N: Tamanho do tabuleiro (N x N).
+
+    Returns:
+        True se todas as colunas estão no tabuleiro e nenhuma coluna ou diagonal se repete.
+    """
+    count = len(genes)
+    if not 1 <= count <= N or any(not 0 <= col < N for col in genes):
+        return False
+    return (len(set(genes)) == count
+            and len({row - col for row, col in enumerate(genes)}) == count
+            and len({row + col for row, col in enumerate(genes)}) == count)
+
+class IndexedSolutions:
+    def __init__(self, queens, N, genes, complete):
+        """
+        Soluções de um par (rainhas, N), guardadas em sequência em um único array.
+
+        Args:
+            queens: Número de rainhas.
+            N: Tamanho do tabuleiro (N x N).
+            genes: Array com os genes de todas as soluções, uma após a outra.
+            complete: True se o array contém todas as soluções existentes.
+        """
+        self.queens = queens
+        self.N = N
+        self.genes = genes
+        self.complete = complete
+        self._keys = None
+
+    def __len__(self):
+        return len(self.genes) // self.queens
+
+    def __getitem__(self, index):
+        if not -len(self) <= index < len(self):
+            raise IndexError(index)
+        start = (index % len(self)) * self.queens
+        return self.genes[start:start + self.queens]
+
+    def __contains__(self, genes):
+        # O conjunto de chaves só é montado na primeira consulta
+        if self._keys is None:
+            size = self.queens * self.genes.itemsize
+            data = self.genes.tobytes()
+            self._keys = {data[start:start + size] for start in range(0, len(data), size)}
+        try:
+            return array(self.genes.typecode, genes).tobytes() in self._keys
+        except OverflowError:
+            return False
+
+class SolutionIndex:
+    def __init__(self, directory=DEFAULT_INDEX_DIRECTORY, max_solutions=MAX_INDEXED_SOLUTIONS):
+        """
+        Índice de soluções exatas por (rainhas, N), carregado do disco sob demanda.
+
+        Na primeira consulta de um par, o índice é lido do disco ou, se ainda não existir,
+        montado por backtracking e gravado para as próximas execuções.
+
+        Args:
+            directory: Diretório dos arquivos de índice (None para manter o índice só em memória).
+            max_solutions: Número máximo de soluções guardadas por par.
+        """
+        self.directory = directory
+        self.max_solutions = max_solutions
+        self._entries = {}
+
+    def path(self, queens, N):
+        """
+        Returns:
+            Caminho do arquivo de índice do par (rainhas, N).
+        """
+        return os.path.join(self.directory, f"{queens}_{N}.bin")
+
+    def solutions(self, queens, N):
+        """
+        Retorna as soluções indexadas de um par (rainhas, N).
+
+        Args:
+            queens: Número de rainhas.
+            N: Tamanho do tabuleiro (N x N), no máximo MAX_EXACT_N.
+
+        Returns:
+            Objeto IndexedSolutions.
+        """
+        _check_size(N, queens)
+        if N > MAX_EXACT_N:
+            raise ValueError(f"O índice de soluções só é montado para N até {MAX_EXACT_N}.")
+        key = (queens, N)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = self._load(queens, N)
+            if entry is None:
+                entry = self._build(queens, N)
+                self._save(entry)
+            self._entries[key] = entry
+        return entry
+
+    def _build(self, queens, N):
+        genes = array(gene_typecode(N))
+        complete = True
+        for count, solution in enumerate(iter_solutions(N, queens)):
+            if count == self.max_solutions:
+                complete = False
+                break
+            genes.extend(solution)
+        return IndexedSolutions(queens, N, genes, complete)
+
+    def _load(self, queens, N):
+        if self.directory is None:
+            return None
+        try:
+            with open(self.path(queens, N), "rb") as index_file:
+                data = index_file.read()
+        except FileNotFoundError:
+            return None
+        magic, version, typecode, stored_queens, stored_N, stored, complete = HEADER.unpack_from(data, 0)
+        if magic != MAGIC or version != VERSION or (stored_queens, stored_N) != (queens, N):
+            return None
+        genes = array(typecode.decode())
+        genes.frombytes(data[HEADER.size:HEADER.size + stored * queens * genes.itemsize])
+        return IndexedSolutions(queens, N, genes, bool(complete))
+
+    def _save(self, entry):
+        if self.directory is None:
+            return
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(entry.queens, entry.N)
+        temporary_path = f"{path}.tmp"
+        with open(temporary_path, "wb") as index_file:
+            index_file.write(HEADER.pack(MAGIC, VERSION, entry.genes.typecode.encode(), entry.queens, entry.N, len(entry), entry.complete))
+            index_file.write(entry.genes.tobytes())
+        os.replace(temporary_path, path)
+
+    def solution(self, queens, N):
+        """
+        Returns:
+            Uma solução do par (rainhas, N), como tupla de colunas, ou None se não houver.
+            Acima de MAX_EXACT_N, a solução vem de constructive_solution, já que a primeira
+            solução em ordem lexicográfica tem custo exponencial.
+        """
+        if N > MAX_EXACT_N:
+            return constructive_solution(N, queens)
+        entry = self.solutions(queens, N)
+        return tuple(entry[0]) if len(entry) else None
+
+    def random_solution(self, queens, N, rng=random):
+        """
+        Sorteia uma solução do par (rainhas, N).
+
+        Com um índice completo, o sorteio é uniforme entre todas as soluções; caso
+        contrário, a solução vem da função random_solution.
+
+        Args:
+            queens: Número de rainhas.
+            N: Tamanho do tabuleiro (N x N).
+            rng: Gerador aleatório (módulo random ou instância de random.Random).
+
+        Returns:
+            Tupla com a coluna da rainha de cada linha, ou None se não houver solução.
+        """
+        if N <= MAX_EXACT_N:
+            entry = self.solutions(queens, N)
+            if entry.complete:
+                return tuple(entry[rng.randrange(len(entry))]) if len(entry) else None
+        return random_solution(N, queens, rng)
+
+    def count(self, queens, N):
+        """
+        Returns:
+            Número de soluções do par (rainhas, N), pelo índice quando ele está completo.
+        """
+        if N <= MAX_EXACT_N:
+            entry = self.solutions(queens, N)
+            if entry.complete:
+                return len(entry)
+        return count_solutions(N, queens)
+
+    def validate(self, genes, N):
+        """
+        Valida um resultado (por exemplo, do Algoritmo Genético) contra o oráculo exato.
+
+        Args:
+            genes: Sequência com a coluna da rainha de cada linha.
+            N: Tamanho do tabuleiro (N x N).
+
+        Returns:
+            True se os genes formam uma solução sem conflitos. Quando o índice completo do par
+            está disponível, a solução também precisa constar nele.
+        """
+        if not is_valid_solution(genes, N):
+            return False
+        if N <= MAX_EXACT_N:
+            entry = self.solutions(len(genes), N)
+            if entry.complete:
+                return genes in entry
+        return True
+
+def benchmark(N, runs=10, seed=0, permutation=False, index=None, **ga_params):
+    """
+    Compara o tempo até a solução do Algoritmo Genético com o do solucionador exato.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+        runs: Número de execuções do Algoritmo Genético (sementes seed a seed + runs - 1).
+        seed: Semente base.
+        permutation: Se True, compara com N rainhas (codificação por permutação); senão, com 8 rainhas.
+        index: SolutionIndex usado para validar os resultados (padrão: índice em memória).
+        **ga_params: Parâmetros repassados a cli.run_instance.
+
+    Returns:
+        Dicionário com os tempos do solucionador exato, a mediana do tempo até a solução e a
+        taxa de sucesso do Algoritmo Genético, e o número de soluções inválidas encontradas.
+    """
+    from cli import run_instance
+
+    queens = N if permutation else 8
+    index = index or SolutionIndex(directory=None)
+
+    start = time.perf_counter()
+    first_solution(N, queens)
+    exact_first_time = time.perf_counter() - start
+
+    rng = random.Random(seed)
+    exact_random_times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        random_solution(N, queens, rng)
+        exact_random_times.append(time.perf_counter() - start)
+
+    records = [run_instance(N=N, seed=seed + run, run=run, permutation=permutation, **ga_params) for run in range(runs)]
+    solved = [r for r in records if r["conflicts"] == 0]
+    ga_times = [r["wall_time"] for r in solved]
+    return {
+        "N": N,
+        "queens": queens,
+        "runs": runs,
+        "exact_first_time": exact_first_time,
+        "exact_random_median_time": statistics.median(exact_random_times),
+        "ga_success_rate": len(solved) / runs,
+        "ga_median_time_to_solution": statistics.median(ga_times) if ga_times else None,
+        "ga_invalid_solutions": sum(not index.validate(r["genes"], N) for r in solved),
+    }
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Solucionador exato (backtracking com máscaras de bits) para o Problema das N-Rainhas.")
+    parser.add_argument("-n", "--board-size", type=int, default=8, help="Tamanho do tabuleiro NxN.")
+    parser.add_argument("-q", "--queens", type=int, default=None, help="Número de rainhas (padrão: N).")
+    parser.add_argument("--count", action="store_true", help="Conta as soluções em vez de mostrar uma.")
+    parser.add_argument("--random", action="store_true", help="Sorteia uma solução em vez de mostrar a primeira.")
+    parser.add_argument("--benchmark", type=int, default=0, metavar="RUNS", help="Compara o Algoritmo Genético com o solucionador exato.")
+    parser.add_argument("--permutation", action="store_true", help="No benchmark, usa o Algoritmo Genético com N rainhas (permutação).")
+    parser.add_argument("-s", "--seed", type=int, default=None, help="Semente do sorteio e do benchmark.")
+    parser.add_argument("--index-dir", default=DEFAULT_INDEX_DIRECTORY, help="Diretório do índice de soluções.")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    queens = args.queens or args.board_size
+    if not 1 <= queens <= args.board_size:
+        parser.error("O número de rainhas deve estar entre 1 e N.")
+
+    index = SolutionIndex(args.index_dir)
+    if args.benchmark:
+        result = benchmark(args.board_size, runs=args.benchmark, seed=args.seed or 0, permutation=args.permutation, index=index)
+    elif args.count:
+        result = {"N": args.board_size, "queens": queens, "count": index.count(queens, args.board_size)}
+    elif args.random:
+        result = {"N": args.board_size, "queens": queens, "genes": index.random_solution(queens, args.board_size, random.Random(args.seed))}
+    else:
+        result = {"N": args.board_size, "queens": queens, "genes": index.solution(queens, args.board_size)}
+    print(json.dumps(result))
+
+if __name__ == "__main__":
+    main()
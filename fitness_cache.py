@@ -0,0 +1,96 @@
+import hashlib
+from array import array
+from collections import OrderedDict
+
+# Genótipos codificados acima deste tamanho (em bytes) são resumidos por um hash de 16 bytes
+MAX_RAW_KEY_BYTES = 64
+
+def genotype_key(genes):
+    """
+    Codifica os genes em uma chave compacta e hashable.
+
+    Args:
+        genes: Lista ou array de inteiros com a coluna de cada rainha.
+
+    Returns:
+        Objeto bytes que identifica o genótipo.
+    """
+    if isinstance(genes, array):
+        encoded = genes.tobytes()
+    elif max(genes, default=0) < 256:
+        encoded = bytes(genes)
+    else:
+        encoded = array("I", genes).tobytes()
+    if len(encoded) > MAX_RAW_KEY_BYTES:
+        return hashlib.blake2b(encoded, digest_size=16).digest()
+    return encoded
+
+class LRUCache:
+    def __init__(self, max_size):
+        """
+        Inicializa um cache chave-valor com remoção do item usado há mais tempo (LRU).
+
+        Args:
+            max_size: Número máximo de itens guardados.
+        """
+        if max_size < 1:
+            raise ValueError("O tamanho do cache deve ser pelo menos 1.")
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def get(self, key):
+        """
+        Busca o valor de uma chave, marcando-a como usada recentemente.
+
+        Args:
+            key: Chave buscada.
+
+        Returns:
+            Valor guardado, ou None se a chave não estiver no cache.
+        """
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Guarda o valor de uma chave, removendo o item menos usado se o cache estiver cheio.
+
+        Args:
+            key: Chave do item.
+            value: Valor guardado (não pode ser None).
+        """
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    @property
+    def hit_rate(self):
+        """
+        Fração das buscas atendidas pelo cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def __len__(self):
+        return len(self._entries)
+
+class FitnessCache(LRUCache):
+    def __init__(self, max_size=4096):
+        """
+        Inicializa um cache de conflitos por genótipo, com remoção LRU.
+
+        As chaves são as retornadas por genotype_key e os valores, o número de conflitos
+        de cada genótipo.
+
+        Args:
+            max_size: Número máximo de genótipos guardados.
+        """
+        super().__init__(max_size)
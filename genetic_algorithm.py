@@ -1,35 +1,283 @@
+import math
 import random
 import heapq
+import time
+from array import array
+from collections import deque
+from itertools import accumulate
+from diversity import population_diversity
+from fitness_cache import FitnessCache, genotype_key
+from profiling import GAStats
+from progress import PrintProgress
+
+# Tentativas de mutação forçada antes de aceitar um filho repetido (ver reject_duplicates)
+DUPLICATE_RETRIES = 3
+
+def gene_typecode(N):
+    """
+    Escolhe o menor tipo de array capaz de guardar colunas de 0 a N - 1.
+
+    Args:
+        N: Tamanho do tabuleiro (N x N).
+
+    Returns:
+        Código de tipo do módulo array.
+    """
+    if N <= 1 << 8:
+        return "B"
+    if N <= 1 << 16:
+        return "H"
+    return "I"
+
+def make_rng(seed=None):
+    """
+    Cria o gerador aleatório de uma instância do algoritmo.
+
+    Args:
+        seed: Semente inteira, None (semente tirada do sistema operacional) ou um
+            random.Random já criado, que é usado diretamente.
+
+    Returns:
+        Instância de random.Random.
+    """
+    return seed if isinstance(seed, random.Random) else random.Random(seed)
+
+def spawn_seeds(seed, n):
+    """
+    Deriva as sementes de n fluxos aleatórios independentes, por exemplo um por processo.
+
+    As sementes derivadas de uma mesma semente são sempre as mesmas, então execuções
+    paralelas também podem ser reproduzidas.
+
+    Args:
+        seed: Semente de origem (inteiro, None ou random.Random, ver make_rng).
+        n: Número de sementes.
+
+    Returns:
+        Lista de n sementes inteiras de 64 bits.
+    """
+    rng = make_rng(seed)
+    return [rng.getrandbits(64) for _ in range(n)]
+
+def random_pair(rng, n):
+    """
+    Sorteia dois índices distintos entre 0 e n - 1 com duas chamadas ao gerador,
+    sem montar a sequência que random.sample exige.
+
+    Args:
+        rng: Gerador aleatório.
+        n: Número de índices (pelo menos 2).
+
+    Returns:
+        Tupla (i, j) com i < j.
+    """
+    i = rng.randrange(n)
+    j = rng.randrange(n - 1)
+    if j >= i:
+        j += 1
+    return (i, j) if i < j else (j, i)
 
 class Chromosome:
-    def __init__(self, genes, N):
+    __slots__ = ("genes", "N", "fitness", "conflicts", "columns", "diagonals", "anti_diagonals")
+
+    def __init__(self, genes, N, conflicts=None):
         """
-        Inicializa um cromossomo com 8 genes representando as posições das rainhas.
+        Inicializa um cromossomo com um gene por rainha representando as posições das rainhas.
 
         Args:
-            genes: Lista de 8 inteiros representando a coluna de cada rainha nas linhas 0 a 7.
+            genes: Lista ou array de inteiros representando a coluna da rainha de cada linha (8 por padrão, linhas 0 a 7).
+                Os genes são guardados em um array compacto.
             N: Tamanho do tabuleiro (N x N).
+            conflicts: Número de conflitos já conhecido (por exemplo, vindo do cache de aptidão).
+                Nesse caso a avaliação é pulada e os contadores só são montados quando necessários.
         """
-        self.genes = genes  # Lista de 8 colunas para as 8 linhas
+        # Uma coluna por linha (8 colunas para as 8 linhas por padrão)
+        self.genes = genes if isinstance(genes, array) else array(gene_typecode(N), genes)
         self.N = N
         self.fitness = 0
         self.conflicts = 0
-        self.calculate_fitness()
+        # Contadores de ocupação: coluna, diagonal principal (linha - coluna) e anti-diagonal (linha + coluna)
+        self.columns = None
+        self.diagonals = None
+        self.anti_diagonals = None
+        if conflicts is None:
+            self.calculate_fitness()
+        else:
+            self.conflicts = conflicts
+            self.fitness = 1 / (1 + conflicts)
+
+    def _ensure_counters(self):
+        """
+        Monta os contadores de ocupação se o cromossomo veio do cache sem eles.
+        """
+        if self.columns is None:
+            self.calculate_fitness()
 
     def calculate_fitness(self):
         """
         Calcula o número de conflitos e a aptidão do cromossomo.
         A aptidão é inversamente proporcional ao número de conflitos.
+
+        Reconstrói os contadores de ocupação a partir dos genes. Cada par de rainhas
+        na mesma coluna ou diagonal conta como um conflito, então uma linha ocupada
+        por k rainhas contribui com k * (k - 1) / 2 conflitos.
         """
+        self.columns = {}
+        self.diagonals = {}
+        self.anti_diagonals = {}
         self.conflicts = 0
-        for i in range(8):
-            for j in range(i + 1, 8):
-                if self.genes[i] == self.genes[j]:
-                    self.conflicts += 1  # Conflito na mesma coluna
-                elif abs(self.genes[i] - self.genes[j]) == abs(i - j):
-                    self.conflicts += 1  # Conflito na diagonal
+        for row, col in enumerate(self.genes):
+            self.conflicts += self._place(row, col)
         self.fitness = 1 / (1 + self.conflicts)
 
+    def _place(self, row, col):
+        """
+        Registra uma rainha nos contadores de ocupação.
+
+        Returns:
+            Número de rainhas já existentes que passam a atacar a nova rainha.
+        """
+        diagonal = row - col
+        anti_diagonal = row + col
+        attacked = (self.columns.get(col, 0) + self.diagonals.get(diagonal, 0)
+                    + self.anti_diagonals.get(anti_diagonal, 0))
+        self.columns[col] = self.columns.get(col, 0) + 1
+        self.diagonals[diagonal] = self.diagonals.get(diagonal, 0) + 1
+        self.anti_diagonals[anti_diagonal] = self.anti_diagonals.get(anti_diagonal, 0) + 1
+        return attacked
+
+    def _remove(self, row, col):
+        """
+        Remove uma rainha dos contadores de ocupação.
+
+        Returns:
+            Número de rainhas restantes que atacavam a rainha removida.
+        """
+        diagonal = row - col
+        anti_diagonal = row + col
+        self.columns[col] -= 1
+        self.diagonals[diagonal] -= 1
+        self.anti_diagonals[anti_diagonal] -= 1
+        return self.columns[col] + self.diagonals[diagonal] + self.anti_diagonals[anti_diagonal]
+
+    def is_conflicted(self, row):
+        """
+        Verifica se a rainha de uma linha é atacada por alguma outra.
+
+        Args:
+            row: Linha da rainha.
+
+        Returns:
+            True se a rainha compartilha uma coluna ou diagonal com outra rainha.
+        """
+        self._ensure_counters()
+        col = self.genes[row]
+        return self.columns[col] > 1 or self.diagonals[row - col] > 1 or self.anti_diagonals[row + col] > 1
+
+    def min_conflicts_column(self, row, rng=random):
+        """
+        Escolhe a coluna onde a rainha de uma linha seria atacada pelo menor número de rainhas.
+
+        Usa os contadores de ocupação, então custa O(N) sem reavaliar o cromossomo.
+
+        Args:
+            row: Linha da rainha.
+            rng: Gerador aleatório usado nos desempates (módulo random ou instância de random.Random).
+
+        Returns:
+            Coluna com menos ataques; empates são sorteados.
+        """
+        self._ensure_counters()
+        current = self.genes[row]
+        columns = self.columns
+        diagonals = self.diagonals
+        anti_diagonals = self.anti_diagonals
+        best_columns = []
+        best_attacks = None
+        for col in range(self.N):
+            attacks = columns.get(col, 0) + diagonals.get(row - col, 0) + anti_diagonals.get(row + col, 0)
+            if col == current:
+                attacks -= 3  # A própria rainha não conta como atacante
+            if best_attacks is None or attacks < best_attacks:
+                best_attacks = attacks
+                best_columns = [col]
+            elif attacks == best_attacks:
+                best_columns.append(col)
+        return rng.choice(best_columns)
+
+    def set_gene(self, row, col):
+        """
+        Move a rainha de uma linha para outra coluna, atualizando os conflitos em O(1).
+
+        Args:
+            row: Linha da rainha a ser movida.
+            col: Nova coluna da rainha.
+        """
+        old_col = self.genes[row]
+        if old_col == col:
+            return
+        self._ensure_counters()
+        self.conflicts -= self._remove(row, old_col)
+        self.genes[row] = col
+        self.conflicts += self._place(row, col)
+        self.fitness = 1 / (1 + self.conflicts)
+
+    def copy(self):
+        """
+        Cria uma cópia independente do cromossomo, incluindo os contadores, sem reavaliá-lo.
+        Se os contadores ainda não foram montados, a cópia também fica sem eles.
+
+        Returns:
+            Novo objeto Chromosome.
+        """
+        clone = Chromosome.__new__(Chromosome)
+        clone.genes = array(self.genes.typecode, self.genes)
+        clone.N = self.N
+        clone.fitness = self.fitness
+        clone.conflicts = self.conflicts
+        if self.columns is None:
+            clone.columns = clone.diagonals = clone.anti_diagonals = None
+        else:
+            clone.columns = self.columns.copy()
+            clone.diagonals = self.diagonals.copy()
+            clone.anti_diagonals = self.anti_diagonals.copy()
+        return clone
+
+    def assign(self, other):
+        """
+        Sobrescreve este cromossomo com o conteúdo de outro, reaproveitando seus buffers.
+
+        Args:
+            other: Cromossomo de origem, do mesmo tamanho de tabuleiro.
+        """
+        self.genes[:] = other.genes
+        self.N = other.N
+        self.fitness = other.fitness
+        self.conflicts = other.conflicts
+        if other.columns is None:
+            self.columns = self.diagonals = self.anti_diagonals = None
+        elif self.columns is None:
+            self.columns = other.columns.copy()
+            self.diagonals = other.diagonals.copy()
+            self.anti_diagonals = other.anti_diagonals.copy()
+        else:
+            for mine, theirs in ((self.columns, other.columns), (self.diagonals, other.diagonals),
+                                 (self.anti_diagonals, other.anti_diagonals)):
+                mine.clear()
+                mine.update(theirs)
+
+    def set_conflicts(self, conflicts):
+        """
+        Define um número de conflitos já conhecido (por exemplo, vindo do cache de aptidão).
+        Os contadores de ocupação são descartados e remontados quando necessários.
+
+        Args:
+            conflicts: Número de conflitos dos genes atuais.
+        """
+        self.conflicts = conflicts
+        self.fitness = 1 / (1 + conflicts)
+        self.columns = self.diagonals = self.anti_diagonals = None
+
     def __lt__(self, other):
         """
         Define a ordem baseada na aptidão para uso em estruturas como heap.
@@ -42,8 +290,44 @@ class Chromosome:
         """
         return self.fitness > other.fitness  # Maior fitness tem prioridade
 
+class GenerationSnapshot:
+    __slots__ = ("generation", "fitness", "conflicts", "best", "mutation_prob", "elapsed", "diversity")
+
+    def __init__(self, generation, fitness, conflicts, best, mutation_prob, elapsed, diversity=None):
+        """
+        Estado do algoritmo ao fim de uma geração, produzido por GeneticAlgorithm.iter_run.
+
+        Args:
+            generation: Número da geração.
+            fitness: Melhor aptidão encontrada até agora.
+            conflicts: Conflitos do melhor cromossomo.
+            best: Melhor cromossomo até agora. O algoritmo nunca o altera no lugar (cada melhora
+                gera uma nova cópia), então ele pode ser guardado sem copiar.
+            mutation_prob: Probabilidade de mutação em uso (pode ter sido adaptada).
+            elapsed: Tempo, em segundos, desde o início da iteração.
+            diversity: Diversidade da população (DiversityStats), se track_diversity estiver ativado.
+        """
+        self.generation = generation
+        self.fitness = fitness
+        self.conflicts = conflicts
+        self.best = best
+        self.mutation_prob = mutation_prob
+        self.elapsed = elapsed
+        self.diversity = diversity
+
+    @property
+    def solved(self):
+        """
+        True se o melhor cromossomo não tem conflitos.
+        """
+        return self.conflicts == 0
+
 class GeneticAlgorithm:
-    def __init__(self, N, population_size=100, mutation_prob=0.05, crossover_prob=0.8, generations=1000, elite_size=5):
+    chromosome_class = Chromosome  # Classe usada para criar novos cromossomos
+
+    def __init__(self, N, population_size=100, mutation_prob=0.05, crossover_prob=0.8, generations=1000, elite_size=5, queens=8, fitness_cache_size=0, profile=False,
+                 progress=None, history_size=None, population=None, local_search_rate=0.0, local_search_elites=False, local_search_budget=1000,
+                 track_diversity=False, reject_duplicates=False, restart_after=None, restart_fraction=0.5, seed=None):
         """
         Inicializa o Algoritmo Genético para o problema das 8-Rainhas em um tabuleiro N x N.
 
@@ -54,17 +338,87 @@ class GeneticAlgorithm:
             crossover_prob: Probabilidade de realizar crossover entre dois pais.
             generations: Número máximo de gerações a serem executadas.
             elite_size: Número de melhores cromossomos preservados em cada geração.
+            queens: Número de rainhas (uma por linha, a partir da linha 0).
+            fitness_cache_size: Número máximo de genótipos no cache de aptidão (0 desativa o cache).
+            profile: Se True, mede o tempo de cada fase (ver enable_profiling).
+            progress: Destino do progresso por geração (ver progress.py); padrão: imprime toda geração.
+            history_size: Se definido, conflicts_history guarda apenas as últimas history_size gerações.
+            population: População inicial já avaliada (por exemplo, restaurada de um checkpoint).
+                Se omitida, uma população aleatória é gerada.
+            local_search_rate: Fração dos filhos de cada geração melhorada por busca local (0 desativa).
+            local_search_elites: Se True, os elites de cada geração também passam pela busca local.
+            local_search_budget: Número máximo de passos de busca local por geração, dividido
+                igualmente entre os cromossomos escolhidos.
+            track_diversity: Se True, mede a diversidade da população a cada geração (ver diversity.py).
+            reject_duplicates: Se True, filhos idênticos a um cromossomo já presente na nova população
+                sofrem mutações forçadas (até DUPLICATE_RETRIES) antes de serem aceitos.
+            restart_after: Se definido, após esse número de gerações sem melhora parte da
+                população é substituída por cromossomos aleatórios, preservando os elites.
+            restart_fraction: Fração da população substituída em cada reinício parcial.
+            seed: Semente ou gerador (random.Random) usado em todos os sorteios desta instância;
+                a mesma semente e os mesmos parâmetros reproduzem a execução exatamente.
         """
+        self.rng = make_rng(seed)
+        # Semente inteira da execução (None se não houver), guardada nos checkpoints para os registros
+        self.seed = seed if isinstance(seed, int) else None
         self.N = N  # Tamanho do tabuleiro (N x N)
+        self.queens = queens
         self.population_size = population_size
         self.mutation_prob = mutation_prob
         self.crossover_prob = crossover_prob
         self.generations = generations
         self.elite_size = elite_size
-        self.population = self.create_initial_population()
-        self.best_chromosome = max(self.population, key=lambda c: c.fitness)
+        self.local_search_rate = local_search_rate
+        self.local_search_elites = local_search_elites
+        self.local_search_budget = local_search_budget
+        self.track_diversity = track_diversity
+        self.reject_duplicates = reject_duplicates
+        self.restart_after = restart_after
+        self.restart_fraction = restart_fraction
+        self.diversity = None  # Diversidade da última geração, quando track_diversity está ativado
+        self.restarts = 0  # Número de reinícios parciais realizados
+        self.fitness_cache = FitnessCache(fitness_cache_size) if fitness_cache_size else None
+        self.stats = None  # Estatísticas por fase, quando o perfilamento está ativado
+        if profile:
+            self.enable_profiling()
+        self.population = population if population is not None else self.create_initial_population()
+        # Segundo buffer de população: cada geração escreve os filhos no buffer livre e os dois se alternam
+        self._next_population = [chromosome.copy() for chromosome in self.population]
+        self._cum_weights = None  # Pesos acumulados da roleta para a geração atual
+        self.elites = []  # Elites preservados na última geração
+        self.best_chromosome = max(self.population, key=lambda c: c.fitness).copy()
         self.no_improvement = 0
-        self.conflicts_history = []  # Para plotagem do progresso
+        self.generation = 0  # Última geração concluída
+        # Motivo do fim da última execução: "solved", "generations", "max_generations", "time" ou "cancelled"
+        self.stop_reason = None
+        self.progress = progress if progress is not None else PrintProgress()
+        # Para plotagem do progresso; com history_size, funciona como um buffer circular
+        self.conflicts_history = deque(maxlen=history_size) if history_size else []
+
+    def enable_profiling(self):
+        """
+        Ativa a medição de tempo por fase e de avaliações por segundo.
+
+        Os métodos de cada fase são substituídos, nesta instância, por versões cronometradas;
+        com o perfilamento desativado nenhum código de medição é executado.
+
+        Returns:
+            Objeto GAStats, também disponível em self.stats durante e após run().
+        """
+        stats = GAStats()
+        self.select_elites = stats.wrap("elitism", self.select_elites)
+        self.tournament_selection_batch = stats.wrap("tournament_selection", self.tournament_selection_batch)
+        self.prepare_selection = stats.wrap("roulette_selection", self.prepare_selection)
+        self.roulette_selection_batch = stats.wrap("roulette_selection", self.roulette_selection_batch)
+        self.crossover = stats.wrap("crossover", self.crossover)
+        self.mutate = stats.wrap("mutate", self.mutate)
+        self.local_search = stats.wrap("local_search", self.local_search)
+        self.measure_diversity = stats.wrap("diversity", self.measure_diversity)
+        self.partial_restart = stats.wrap("restart", self.partial_restart)
+        self.evaluate = stats.wrap("calculate_fitness", self.evaluate)
+        self.new_chromosome = stats.wrap("calculate_fitness", self.new_chromosome)
+        self.stats = stats
+        return stats
 
     def create_initial_population(self):
         """
@@ -73,11 +427,65 @@ class GeneticAlgorithm:
         Returns:
             Lista de objetos Chromosome.
         """
-        population = []
-        for _ in range(self.population_size):
-            genes = [random.randint(0, self.N - 1) for _ in range(8)]
-            population.append(Chromosome(genes, self.N))
-        return population
+        return [self.new_chromosome(self.random_genes()) for _ in range(self.population_size)]
+
+    def random_genes(self):
+        """
+        Sorteia os genes de um novo cromossomo.
+
+        Returns:
+            Lista com uma coluna aleatória para cada rainha.
+        """
+        randrange = self.rng.randrange
+        N = self.N
+        return [randrange(N) for _ in range(self.queens)]
+
+    def new_chromosome(self, genes):
+        """
+        Cria um cromossomo avaliado, consultando o cache de aptidão quando ativado.
+
+        Args:
+            genes: Genes do novo cromossomo.
+
+        Returns:
+            Objeto da classe chromosome_class.
+        """
+        if self.fitness_cache is None:
+            return self.chromosome_class(genes, self.N)
+        key = genotype_key(genes)
+        conflicts = self.fitness_cache.get(key)
+        if conflicts is not None:
+            return self.chromosome_class(genes, self.N, conflicts=conflicts)
+        chromosome = self.chromosome_class(genes, self.N)
+        self.fitness_cache.put(key, chromosome.conflicts)
+        return chromosome
+
+    def evaluate(self, chromosome):
+        """
+        Reavalia um cromossomo cujos genes foram reescritos, consultando o cache de aptidão quando ativado.
+
+        Args:
+            chromosome: Cromossomo a ser avaliado no próprio lugar.
+        """
+        if self.fitness_cache is None:
+            chromosome.calculate_fitness()
+            return
+        key = genotype_key(chromosome.genes)
+        conflicts = self.fitness_cache.get(key)
+        if conflicts is not None:
+            chromosome.set_conflicts(conflicts)
+        else:
+            chromosome.calculate_fitness()
+            self.fitness_cache.put(key, chromosome.conflicts)
+
+    def prepare_selection(self):
+        """
+        Monta a distribuição de seleção da geração atual.
+
+        Os pesos acumulados da roleta são calculados uma única vez por geração,
+        em vez de a cada pai sorteado.
+        """
+        self._cum_weights = list(accumulate(c.fitness for c in self.population))
 
     def roulette_selection(self):
         """
@@ -86,10 +494,21 @@ class GeneticAlgorithm:
         Returns:
             Objeto Chromosome selecionado.
         """
-        fitness_sum = sum(c.fitness for c in self.population)
-        selection_probs = [c.fitness / fitness_sum for c in self.population]
-        selected = random.choices(self.population, weights=selection_probs, k=1)[0]
-        return selected
+        return self.roulette_selection_batch(1)[0]
+
+    def roulette_selection_batch(self, n):
+        """
+        Seleciona n cromossomos de uma só vez usando o método de roleta.
+
+        Args:
+            n: Número de cromossomos a selecionar.
+
+        Returns:
+            Lista de objetos Chromosome selecionados.
+        """
+        if self._cum_weights is None:
+            self.prepare_selection()
+        return self.rng.choices(self.population, cum_weights=self._cum_weights, k=n)
 
     def tournament_selection(self, k=3):
         """
@@ -101,67 +520,271 @@ class GeneticAlgorithm:
         Returns:
             Objeto Chromosome selecionado.
         """
-        selected = random.sample(self.population, k)
+        selected = self.rng.sample(self.population, k)
         return max(selected, key=lambda c: c.fitness)
 
-    def crossover(self, parent1, parent2):
+    def tournament_selection_batch(self, n, k=3):
+        """
+        Seleciona n cromossomos pelo método de torneio, sorteando todos os competidores de uma vez.
+
+        Diferente de tournament_selection, os competidores de um torneio são sorteados
+        com reposição.
+
+        Args:
+            n: Número de cromossomos a selecionar.
+            k: Número de cromossomos a participar de cada torneio.
+
+        Returns:
+            Lista de objetos Chromosome selecionados.
+        """
+        contestants = self.rng.choices(self.population, k=n * k)
+        return [max(contestants[i:i + k], key=lambda c: c.fitness) for i in range(0, n * k, k)]
+
+    def crossover(self, parent1, parent2, child=None):
         """
         Realiza o crossover para gerar um filho a partir de dois pais.
 
         Args:
             parent1: Cromossomo pai 1.
             parent2: Cromossomo pai 2.
+            child: Cromossomo já alocado onde o filho é escrito (opcional).
 
         Returns:
             Objeto Chromosome filho.
         """
-        child_genes = parent1.genes.copy()
-        if random.random() < self.crossover_prob:
+        # O filho parte de uma cópia do pai 1, herdando seus contadores de conflito
+        if child is None:
+            child = parent1.copy()
+        else:
+            child.assign(parent1)
+        # Com uma única rainha não há dois pontos de corte distintos
+        if self.rng.random() < self.crossover_prob and self.queens > 1:
             # Escolher pontos de crossover
-            start, end = sorted(random.sample(range(8), 2))
-            child_genes[start:end + 1] = parent2.genes[start:end + 1]
-        return Chromosome(child_genes, self.N)
+            start, end = random_pair(self.rng, self.queens)
+            for i in range(start, end + 1):
+                child.set_gene(i, parent2.genes[i])
+        return child
 
     def mutate(self, chromosome):
         """
         Aplica mutação ao cromossomo trocando a coluna de uma rainha.
 
+        Cada gene sofre mutação com probabilidade mutation_prob. Em vez de um sorteio por gene,
+        a distância até o próximo gene mutado é sorteada de uma distribuição geométrica, então
+        o número de chamadas ao gerador acompanha o número de mutações, não o de genes.
+
         Args:
             chromosome: Objeto Chromosome a ser mutado.
         """
-        for i in range(8):
-            if random.random() < self.mutation_prob:
-                chromosome.genes[i] = random.randint(0, self.N - 1)
-        chromosome.calculate_fitness()
+        p = self.mutation_prob
+        if p <= 0:
+            return
+        rng = self.rng
+        N = self.N
+        queens = self.queens
+        if p >= 1:
+            for i in range(queens):
+                chromosome.set_gene(i, rng.randrange(N))
+            return
+        log_keep = math.log1p(-p)
+        i = int(math.log(1.0 - rng.random()) / log_keep)
+        while i < queens:
+            chromosome.set_gene(i, rng.randrange(N))
+            i += 1 + int(math.log(1.0 - rng.random()) / log_keep)
+
+    def perturb(self, chromosome):
+        """
+        Aplica uma mutação obrigatória, movendo uma rainha sorteada para uma coluna sorteada.
+
+        Args:
+            chromosome: Objeto Chromosome a ser alterado.
+        """
+        chromosome.set_gene(self.rng.randrange(self.queens), self.rng.randrange(self.N))
+
+    def local_search(self, chromosome, max_steps):
+        """
+        Melhora um cromossomo por subida de encosta com conflitos mínimos (min-conflicts).
+
+        A cada passo, uma rainha atacada é sorteada e movida para a coluna da sua linha com
+        menos ataques. Os conflitos são atualizados de forma incremental pelos contadores.
+
+        Args:
+            chromosome: Cromossomo a ser melhorado no próprio lugar.
+            max_steps: Número máximo de passos.
+
+        Returns:
+            Número de passos executados.
+        """
+        steps = 0
+        while steps < max_steps and chromosome.conflicts:
+            conflicted = [row for row in range(self.queens) if chromosome.is_conflicted(row)]
+            row = self.rng.choice(conflicted)
+            chromosome.set_gene(row, chromosome.min_conflicts_column(row, self.rng))
+            steps += 1
+        return steps
+
+    def apply_local_search(self, new_population, n_elites):
+        """
+        Aplica a busca local aos elites (se ativado) e a uma amostra dos filhos da nova população,
+        sem ultrapassar o orçamento de passos da geração (local_search_budget).
+
+        Args:
+            new_population: Buffer da próxima geração, com os elites no início.
+            n_elites: Número de elites no início do buffer.
+        """
+        targets = list(range(n_elites)) if self.local_search_elites else []
+        n_children = len(new_population) - n_elites
+        if self.local_search_rate > 0 and n_children:
+            sample_size = min(n_children, max(1, round(self.local_search_rate * n_children)))
+            targets.extend(self.rng.sample(range(n_elites, len(new_population)), sample_size))
+        # Com mais alvos que passos no orçamento, cada alvo escolhido recebe um único passo
+        del targets[self.local_search_budget:]
+        if not targets:
+            return
+        max_steps = self.local_search_budget // len(targets)
+        for index in targets:
+            self.local_search(new_population[index], max_steps)
 
     def evolve_population(self):
         """
         Evolui a população para a próxima geração.
         """
-        new_population = []
+        stats = self.stats
+        if stats is not None:
+            stats.start_generation()
+
+        # Os filhos são escritos no buffer livre, sem alocar novos cromossomos
+        new_population = self._next_population
+
         # Elitismo: preserva os melhores cromossomos
-        elites = heapq.nlargest(self.elite_size, self.population, key=lambda c: c.fitness)
-        new_population.extend(elites)
+        n_elites = self.select_elites(new_population)
 
-        # Geração dos novos indivíduos
-        while len(new_population) < self.population_size:
-            parent1 = self.tournament_selection()
-            parent2 = self.roulette_selection()
-            child = self.crossover(parent1, parent2)
+        # Geração dos novos indivíduos, com os pais sorteados em lote
+        n_children = self.population_size - n_elites
+        self.prepare_selection()
+        parents1 = self.tournament_selection_batch(n_children)
+        parents2 = self.roulette_selection_batch(n_children)
+        seen = {genotype_key(elite.genes) for elite in self.elites} if self.reject_duplicates else None
+        for child, parent1, parent2 in zip(new_population[n_elites:], parents1, parents2):
+            self.crossover(parent1, parent2, child)
             self.mutate(child)
-            new_population.append(child)
+            if seen is not None:
+                # Clones não trazem informação nova: o filho repetido é perturbado até ser inédito
+                key = genotype_key(child.genes)
+                for _ in range(DUPLICATE_RETRIES):
+                    if key not in seen:
+                        break
+                    self.perturb(child)
+                    key = genotype_key(child.genes)
+                seen.add(key)
+
+        # Busca local opcional (algoritmo memético)
+        if self.local_search_rate > 0 or self.local_search_elites:
+            self.apply_local_search(new_population, n_elites)
 
-        # Atualiza a população
+        # Atualiza a população, alternando os buffers
+        self._next_population = self.population
         self.population = new_population
+        self._cum_weights = None
         self.update_best_chromosome()
 
+        # Reinício parcial: após restart_after gerações sem melhora, parte da população é renovada
+        if self.restart_after and self.no_improvement >= self.restart_after:
+            self.partial_restart()
+        if self.track_diversity:
+            self.measure_diversity()
+
+        if stats is not None:
+            stats.end_generation(n_children)
+
+    def measure_diversity(self):
+        """
+        Mede a diversidade da população atual.
+
+        Returns:
+            Objeto DiversityStats, também guardado em self.diversity.
+        """
+        self.diversity = population_diversity(self.population, self.N)
+        return self.diversity
+
+    def partial_restart(self):
+        """
+        Substitui os piores cromossomos da população por cromossomos aleatórios, preservando os elites.
+
+        O número de cromossomos substituídos é restart_fraction do tamanho da população,
+        limitado aos que não são elites.
+        """
+        count = round(self.restart_fraction * len(self.population))
+        worst = self.replaceable_indices(count)
+        if not worst:
+            return
+        for index in worst:
+            self.population[index] = self.new_chromosome(self.random_genes())
+        self._cum_weights = None
+        self.no_improvement = 0
+        self.restarts += 1
+
+    def replaceable_indices(self, count):
+        """
+        Escolhe as posições dos piores cromossomos da população, sem incluir os elite_size melhores.
+
+        A ordenação é estável: entre cromossomos de mesma aptidão, os que aparecem primeiro
+        são considerados melhores. Como select_elites põe os elites no início da população,
+        eles nunca são escolhidos, mesmo quando a população convergiu para clones.
+
+        Args:
+            count: Número de posições desejadas.
+
+        Returns:
+            Lista com até count índices (menos, se não houver cromossomos suficientes fora dos elites).
+        """
+        ranked = sorted(range(len(self.population)), key=lambda i: self.population[i].fitness, reverse=True)
+        candidates = ranked[self.elite_size:]
+        count = min(count, len(candidates))
+        return candidates[len(candidates) - count:] if count > 0 else []
+
+    def select_elites(self, new_population):
+        """
+        Copia os melhores cromossomos da população atual para o início da nova população.
+
+        Args:
+            new_population: Buffer da próxima geração.
+
+        Returns:
+            Número de elites copiados.
+        """
+        elites = heapq.nlargest(self.elite_size, self.population, key=lambda c: c.fitness)
+        for slot, elite in zip(new_population, elites):
+            slot.assign(elite)
+        self.elites = new_population[:len(elites)]
+        return len(elites)
+
+    def receive_migrants(self, migrants):
+        """
+        Substitui os piores cromossomos da população por migrantes de outra população,
+        preservando os elites.
+
+        Args:
+            migrants: Lista de listas de genes recebidas de outra ilha.
+        """
+        if not migrants:
+            return
+        worst = self.replaceable_indices(len(migrants))
+        for index, genes in zip(worst, migrants):
+            self.population[index] = self.new_chromosome(list(genes))
+        self._cum_weights = None
+        current_best = max(self.population, key=lambda c: c.fitness)
+        if current_best.fitness > self.best_chromosome.fitness:
+            self.best_chromosome = current_best.copy()
+
     def update_best_chromosome(self):
         """
         Atualiza o melhor cromossomo encontrado.
         """
         current_best = max(self.population, key=lambda c: c.fitness)
         if current_best.fitness > self.best_chromosome.fitness:
-            self.best_chromosome = current_best
+            # Cópia, pois o cromossomo atual será sobrescrito quando os buffers se alternarem
+            self.best_chromosome = current_best.copy()
             self.no_improvement = 0
         else:
             self.no_improvement += 1
@@ -169,28 +792,147 @@ class GeneticAlgorithm:
                 # Aumenta a taxa de mutação para promover diversidade
                 self.mutation_prob = min(self.mutation_prob * 1.1, 0.5)
 
-    def run(self, callback=None):
+    def iter_run(self, cancel=None, max_time=None, max_generations=None):
+        """
+        Executa o algoritmo sob demanda, produzindo um GenerationSnapshot a cada geração.
+
+        Nenhuma geração é calculada antes de ser pedida, então quem consome o gerador controla
+        o ritmo e pode abandoná-lo a qualquer momento (por exemplo, com close()). A execução
+        continua a partir de self.generation, como em run().
+
+        Args:
+            cancel: Objeto com is_set() (por exemplo, threading.Event ou multiprocessing.Event),
+                verificado antes de cada geração para cancelamento cooperativo.
+            max_time: Tempo máximo, em segundos, desta execução.
+            max_generations: Número máximo de gerações desta execução, além do limite self.generations.
+
+        Yields:
+            Objeto GenerationSnapshot. O gerador termina após a geração que encontra a solução.
+        """
+        started = time.monotonic()
+        deadline = started + max_time if max_time is not None else None
+        last_generation = self.generations
+        if max_generations is not None:
+            last_generation = min(last_generation, self.generation + max_generations)
+
+        # Um algoritmo restaurado que já havia encontrado a solução não evolui novamente
+        if self.generation and self.best_chromosome.conflicts == 0:
+            self.stop_reason = "solved"
+            self.progress.flush()
+            return
+
+        self.stop_reason = None
+        try:
+            for generation in range(self.generation + 1, last_generation + 1):
+                if cancel is not None and cancel.is_set():
+                    self.stop_reason = "cancelled"
+                    return
+                if deadline is not None and time.monotonic() >= deadline:
+                    self.stop_reason = "time"
+                    return
+
+                self.evolve_population()
+                self.generation = generation
+                best = self.best_chromosome
+                self.conflicts_history.append(best.conflicts)
+                self.progress.generation(generation, best.fitness, best.conflicts, self)
+
+                # Condição de parada: solução sem conflitos
+                if best.conflicts == 0:
+                    self.stop_reason = "solved"
+                    self.progress.solution_found(generation, self)
+                yield GenerationSnapshot(generation, best.fitness, best.conflicts, best, self.mutation_prob,
+                                         time.monotonic() - started, self.diversity)
+                if best.conflicts == 0:
+                    return
+            self.stop_reason = "generations" if last_generation == self.generations else "max_generations"
+        finally:
+            if self.stop_reason is None:
+                # O gerador foi fechado por quem o consumia
+                self.stop_reason = "cancelled"
+            # Apenas grava o pendente: o destino pertence a quem o criou e pode servir a outra execução
+            self.progress.flush()
+
+    async def aiter_run(self, cancel=None, max_time=None, max_generations=None):
+        """
+        Variante assíncrona de iter_run, para uso com asyncio (async for).
+
+        Após cada geração o controle volta ao laço de eventos, então outras tarefas continuam
+        respondendo e o cancelamento da tarefa (Task.cancel) interrompe a execução.
+
+        Args:
+            cancel: Objeto com is_set() verificado antes de cada geração.
+            max_time: Tempo máximo, em segundos, desta execução.
+            max_generations: Número máximo de gerações desta execução.
+
+        Yields:
+            Objeto GenerationSnapshot.
+        """
+        import asyncio
+
+        snapshots = self.iter_run(cancel=cancel, max_time=max_time, max_generations=max_generations)
+        try:
+            for snapshot in snapshots:
+                yield snapshot
+                await asyncio.sleep(0)
+        finally:
+            snapshots.close()
+
+    async def arun(self, callback=None, cancel=None, max_time=None, max_generations=None):
+        """
+        Variante assíncrona de run.
+
+        Args:
+            callback: Função chamada após cada geração, com a mesma assinatura do callback de run:
+                callback(generation, fitness, conflicts). Para o GenerationSnapshot completo, use aiter_run.
+            cancel: Objeto com is_set() verificado antes de cada geração.
+            max_time: Tempo máximo, em segundos, desta execução.
+            max_generations: Número máximo de gerações desta execução.
+
+        Returns:
+            Objeto Chromosome com a melhor solução.
+        """
+        if callback and self.stats is not None:
+            callback = self.stats.wrap("callback", callback)
+        async for snapshot in self.aiter_run(cancel=cancel, max_time=max_time, max_generations=max_generations):
+            if callback:
+                callback(snapshot.generation, snapshot.fitness, snapshot.conflicts)
+        return self.best_chromosome
+
+    def run(self, callback=None, checkpoint_path=None, checkpoint_interval=30.0, cancel=None, max_time=None, max_generations=None):
         """
         Executa o algoritmo genético e retorna o melhor cromossomo encontrado.
 
+        A execução continua a partir de self.generation, então um algoritmo restaurado
+        com checkpoint.load_checkpoint retoma exatamente de onde parou. O motivo do fim
+        da execução fica em self.stop_reason.
+
         Args:
             callback: Função a ser chamada após cada geração, para atualizar a GUI.
+            checkpoint_path: Se definido, o estado é salvo nesse arquivo periodicamente e ao final.
+            checkpoint_interval: Intervalo mínimo, em segundos, entre dois checkpoints.
+            cancel: Objeto com is_set() (por exemplo, threading.Event), verificado antes de cada geração.
+            max_time: Tempo máximo, em segundos, desta execução.
+            max_generations: Número máximo de gerações desta execução.
 
         Returns:
             Objeto Chromosome com a melhor solução.
         """
-        for generation in range(1, self.generations + 1):
-            self.evolve_population()
-            self.conflicts_history.append(self.best_chromosome.conflicts)
-            print(f"Geração {generation}: Melhor Aptidão = {self.best_chromosome.fitness:.4f}, Conflitos = {self.best_chromosome.conflicts}")
+        if callback and self.stats is not None:
+            callback = self.stats.wrap("callback", callback)
+        if checkpoint_path:
+            from checkpoint import save_checkpoint
+            last_checkpoint = time.monotonic()
 
+        for snapshot in self.iter_run(cancel=cancel, max_time=max_time, max_generations=max_generations):
             # Chama o callback para atualizar a GUI
             if callback:
-                callback(generation, self.best_chromosome.fitness, self.best_chromosome.conflicts)
+                callback(snapshot.generation, snapshot.fitness, snapshot.conflicts)
 
-            # Condição de parada: solução sem conflitos
-            if self.best_chromosome.conflicts == 0:
-                print(f"Solução encontrada na geração {generation}!")
-                break
+            if checkpoint_path and not snapshot.solved and time.monotonic() - last_checkpoint >= checkpoint_interval:
+                save_checkpoint(self, checkpoint_path)
+                last_checkpoint = time.monotonic()
 
+        if checkpoint_path:
+            save_checkpoint(self, checkpoint_path)
         return self.best_chromosome
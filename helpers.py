@@ -18,25 +18,36 @@ QUEEN_COLORS = [
     "#00FF00"   # Lime
 ]
 
+# Acima deste tamanho, print_board_tkinter lista as posições em vez de desenhar o tabuleiro
+MAX_PRINTED_BOARD_SIZE = 64
+
+# Cor usada quando cada casa do tabuleiro ocupa menos de um pixel
+DENSE_BOARD_COLOR = "#808080"
+# Tamanho máximo de uma casa (em pixels) ao aproximar o tabuleiro
+MAX_ZOOM_TILE_SIZE = 64
+
+# Parâmetros padrão da animação das rainhas
+ANIMATION_DURATION = 0.6  # Duração total, em segundos, independente do número de rainhas
+ANIMATION_FPS = 60
+ANIMATION_FRAME_BUDGET = 0.012  # Tempo máximo de um quadro; acima disso a animação salta para o fim
+
 def draw_board_tkinter(canvas, N):
     """
     Desenha o tabuleiro de xadrez no Canvas do Tkinter.
 
+    O tabuleiro é desenhado como uma única imagem, então o custo não depende de N.
+
     Args:
         canvas: Widget Canvas do Tkinter onde o tabuleiro será desenhado.
         N: Tamanho do tabuleiro (N x N).
+
+    Returns:
+        Objeto BoardViewport que controla o desenho e a aproximação do tabuleiro.
     """
-    tile_size = calculate_tile_size(canvas, N)
-    canvas.delete("all")  # Limpa o canvas antes de desenhar
-
-    for row in range(N):
-        for col in range(N):
-            color = WHITE_COLOR if (row + col) % 2 == 0 else BLACK_COLOR
-            x1 = col * tile_size
-            y1 = row * tile_size
-            x2 = x1 + tile_size
-            y2 = y1 + tile_size
-            canvas.create_rectangle(x1, y1, x2, y2, fill=color, outline="")
+    size = min(int(canvas['width']), int(canvas['height']))
+    viewport = BoardViewport(canvas, N, size)
+    viewport.render()
+    return viewport
 
 def calculate_tile_size(canvas, N):
     """
@@ -47,51 +58,321 @@ def calculate_tile_size(canvas, N):
         N: Tamanho do tabuleiro (N x N).
 
     Returns:
-        Tamanho do tile em pixels.
+        Tamanho do tile em pixels (fracionário quando o tabuleiro tem mais casas do que pixels).
     """
     canvas_width = int(canvas['width'])
     canvas_height = int(canvas['height'])
-    tile_size = min(canvas_width, canvas_height) // N
-    return tile_size
+    size = min(canvas_width, canvas_height)
+    if N > size:
+        return size / N
+    return size // N
+
+def checkerboard_block(tile_size, parity):
+    """
+    Monta os dados de um bloco 2 x 2 casas do tabuleiro, no formato aceito por PhotoImage.put.
+
+    Args:
+        tile_size: Tamanho de cada casa em pixels (inteiro).
+        parity: 0 se a casa do canto superior esquerdo é branca, 1 se é preta.
+
+    Returns:
+        String com as linhas de pixels do bloco.
+    """
+    light = "{" + " ".join([WHITE_COLOR] * tile_size + [BLACK_COLOR] * tile_size) + "}"
+    dark = "{" + " ".join([BLACK_COLOR] * tile_size + [WHITE_COLOR] * tile_size) + "}"
+    first, second = (light, dark) if parity == 0 else (dark, light)
+    return " ".join([first] * tile_size + [second] * tile_size)
+
+class BoardViewport:
+    def __init__(self, canvas, N, size):
+        """
+        Controla o desenho do tabuleiro e das rainhas, com aproximação e deslocamento.
+
+        Apenas a região visível é desenhada: o tabuleiro é uma imagem preenchida por
+        repetição de um bloco 2 x 2 casas e só as rainhas visíveis são desenhadas.
+
+        Args:
+            canvas: Widget Canvas do Tkinter onde o tabuleiro será desenhado.
+            N: Tamanho do tabuleiro (N x N).
+            size: Tamanho da área de desenho em pixels.
+        """
+        self.canvas = canvas
+        self.N = N
+        self.size = size
+        self.min_tile_size = size / N if N > size else size // N
+        self.tile_size = self.min_tile_size
+        self.row = 0  # Primeira linha visível
+        self.col = 0  # Primeira coluna visível
+        self.genes = None
+        self.image = None  # Referência mantida para a imagem não ser coletada
+        self._drag_start = None
+
+    def visible_cells(self):
+        """
+        Returns:
+            Número de linhas (e colunas) visíveis.
+        """
+        return min(self.N, int(-(-self.size // self.tile_size)))
+
+    def set_genes(self, genes):
+        """
+        Define as rainhas a desenhar e redesenha a região visível.
+
+        Args:
+            genes: Coluna da rainha de cada linha, ou None para desenhar só o tabuleiro.
+        """
+        self.genes = genes
+        self.render()
+
+    def render(self):
+        """
+        Redesenha a região visível do tabuleiro e das rainhas.
+        """
+        self.canvas.delete("all")
+        tile_size = self.tile_size
+        visible = self.visible_cells()
+        pixels = min(self.size, int(visible * tile_size)) or 1
+        image = tk.PhotoImage(width=pixels, height=pixels)
+        if tile_size >= 1:
+            block = checkerboard_block(int(tile_size), (self.row + self.col) % 2)
+            image.put(block, to=(0, 0, pixels, pixels))
+        else:
+            image.put(DENSE_BOARD_COLOR, to=(0, 0, pixels, pixels))
+        self.image = image
+        self.canvas.create_image(0, 0, anchor="nw", image=image)
+        if self.genes is not None:
+            self._draw_queens(visible)
+
+    def _draw_queens(self, visible):
+        tile_size = self.tile_size
+        last_row = min(self.N, self.row + visible, len(self.genes))
+        last_col = self.col + visible
+        if tile_size >= 4:
+            padding = min(10, int(tile_size) // 4)
+            for row in range(self.row, last_row):
+                col = self.genes[row]
+                if self.col <= col < last_col:
+                    x = (col - self.col) * tile_size
+                    y = (row - self.row) * tile_size
+                    self.canvas.create_oval(x + padding, y + padding, x + tile_size - padding, y + tile_size - padding,
+                                            fill=QUEEN_COLORS[row % len(QUEEN_COLORS)])
+            return
+        # Casas pequenas demais para um oval: cada rainha vira um ponto na própria imagem,
+        # e rainhas que caem no mesmo pixel são desenhadas uma única vez
+        dot = max(1, int(tile_size))
+        drawn = set()
+        for row in range(self.row, last_row):
+            col = self.genes[row]
+            if self.col <= col < last_col:
+                x = int((col - self.col) * tile_size)
+                y = int((row - self.row) * tile_size)
+                if (x, y) not in drawn:
+                    drawn.add((x, y))
+                    self.image.put(QUEEN_COLORS[row % len(QUEEN_COLORS)], to=(x, y, x + dot, y + dot))
+
+    def zoom(self, factor, x=0, y=0):
+        """
+        Aproxima ou afasta o tabuleiro mantendo fixa a casa sob o ponto (x, y).
+
+        Args:
+            factor: Maior que 1 para aproximar, menor que 1 para afastar.
+            x: Coordenada x do ponto fixo, em pixels.
+            y: Coordenada y do ponto fixo, em pixels.
+        """
+        tile_size = self.tile_size * factor
+        if tile_size >= 1:
+            # Casas de pelo menos um pixel usam tamanhos inteiros, para o padrão se repetir sem distorção
+            tile_size = round(tile_size)
+            if tile_size == round(self.tile_size):
+                tile_size += 1 if factor > 1 else -1
+        tile_size = min(max(tile_size, self.min_tile_size), max(MAX_ZOOM_TILE_SIZE, self.min_tile_size))
+        if tile_size == self.tile_size:
+            return
+        anchor_row = self.row + y / self.tile_size
+        anchor_col = self.col + x / self.tile_size
+        self.tile_size = tile_size
+        self.row = int(anchor_row - y / tile_size)
+        self.col = int(anchor_col - x / tile_size)
+        self._clamp()
+        self.render()
 
-def animate_solution(canvas, chromosome, N):
+    def pan(self, dx, dy):
+        """
+        Desloca a região visível.
+
+        Args:
+            dx: Deslocamento horizontal em pixels.
+            dy: Deslocamento vertical em pixels.
+        """
+        rows = int(dy / self.tile_size)
+        cols = int(dx / self.tile_size)
+        if not rows and not cols:
+            return False
+        self.row -= rows
+        self.col -= cols
+        self._clamp()
+        self.render()
+        return True
+
+    def _clamp(self):
+        limit = self.N - self.visible_cells()
+        self.row = min(max(self.row, 0), limit)
+        self.col = min(max(self.col, 0), limit)
+
+    def bind(self):
+        """
+        Liga a roda do mouse (aproximar/afastar) e o arraste com o botão esquerdo (deslocar) ao canvas.
+        """
+        self.canvas.bind("<MouseWheel>", lambda e: self.zoom(1.25 if e.delta > 0 else 0.8, e.x, e.y))
+        self.canvas.bind("<Button-4>", lambda e: self.zoom(1.25, e.x, e.y))
+        self.canvas.bind("<Button-5>", lambda e: self.zoom(0.8, e.x, e.y))
+        self.canvas.bind("<ButtonPress-1>", self._start_drag)
+        self.canvas.bind("<B1-Motion>", self._drag)
+
+    def _start_drag(self, event):
+        self._drag_start = (event.x, event.y)
+
+    def _drag(self, event):
+        if self._drag_start is None:
+            return
+        start_x, start_y = self._drag_start
+        if self.pan(event.x - start_x, event.y - start_y):
+            self._drag_start = (event.x, event.y)
+
+class QueenAnimation:
+    def __init__(self, canvas, moves, tile_size, duration=ANIMATION_DURATION, fps=ANIMATION_FPS,
+                 frame_budget=ANIMATION_FRAME_BUDGET, on_done=None):
+        """
+        Anima as rainhas deslizando ao mesmo tempo até suas colunas finais, com quadros
+        agendados por canvas.after, sem bloquear o laço de eventos.
+
+        Rainhas com o mesmo deslocamento compartilham uma tag e são movidas por uma única
+        chamada canvas.move por quadro, então cada quadro custa no máximo um movimento por
+        deslocamento distinto, e não um por rainha.
+
+        Args:
+            canvas: Widget Canvas do Tkinter.
+            moves: Lista de (linha, coluna inicial, coluna final) em coordenadas da área visível.
+            tile_size: Tamanho de cada casa em pixels.
+            duration: Duração total da animação, em segundos.
+            fps: Quadros por segundo desejados.
+            frame_budget: Tempo máximo, em segundos, de um quadro; se excedido, a animação termina imediatamente.
+            on_done: Função chamada sem argumentos quando a animação termina (não é chamada se cancelada).
+        """
+        self.canvas = canvas
+        self.tile_size = tile_size
+        self.duration = duration
+        self.interval = max(1, 1000 // fps)
+        self.frame_budget = frame_budget
+        self.on_done = on_done
+        self.running = False
+        self._job = None
+        self._started = None
+        self._progress = 0.0  # Fração do trajeto já percorrida (após a suavização)
+        self._shifts = {}  # Deslocamento em colunas -> tag das rainhas com esse deslocamento
+
+        padding = min(10, int(tile_size) // 4)
+        for row, initial_col, final_col in moves:
+            shift = final_col - initial_col
+            tag = self._shifts.setdefault(shift, f"animated_queen_{shift}")
+            x = initial_col * tile_size
+            y = row * tile_size
+            canvas.create_oval(x + padding, y + padding, x + tile_size - padding, y + tile_size - padding,
+                               fill=QUEEN_COLORS[row % len(QUEEN_COLORS)], tags=("animated_queen", tag))
+
+    def start(self):
+        """
+        Agenda o primeiro quadro e retorna imediatamente.
+
+        Returns:
+            A própria animação.
+        """
+        self.running = True
+        self._started = time.monotonic()
+        self._job = self.canvas.after(0, self._frame)
+        return self
+
+    def _move_to(self, progress):
+        step = (progress - self._progress) * self.tile_size
+        if step:
+            for shift, tag in self._shifts.items():
+                self.canvas.move(tag, shift * step, 0)
+        self._progress = progress
+
+    def _frame(self):
+        self._job = None
+        frame_start = time.monotonic()
+        t = min(1.0, (frame_start - self._started) / self.duration) if self.duration > 0 else 1.0
+        self._move_to(t * t * (3 - 2 * t))  # Suavização (smoothstep) no início e no fim
+        if t >= 1.0:
+            self._finish()
+        elif time.monotonic() - frame_start > self.frame_budget:
+            self.skip()
+        else:
+            self._job = self.canvas.after(self.interval, self._frame)
+
+    def _finish(self):
+        self.running = False
+        if self.on_done:
+            self.on_done()
+
+    def skip(self):
+        """
+        Leva todas as rainhas às posições finais imediatamente.
+        """
+        if not self.running:
+            return
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+        self._move_to(1.0)
+        self._finish()
+
+    def cancel(self):
+        """
+        Interrompe a animação e remove as rainhas animadas do canvas.
+        """
+        if self._job is not None:
+            self.canvas.after_cancel(self._job)
+            self._job = None
+        self.running = False
+        self.canvas.delete("animated_queen")
+
+def animate_solution(canvas, chromosome, N, viewport=None, duration=ANIMATION_DURATION, fps=ANIMATION_FPS,
+                     frame_budget=ANIMATION_FRAME_BUDGET, on_done=None):
     """
-    Anima as rainhas movendo-se para suas posições finais.
+    Anima as rainhas movendo-se, todas ao mesmo tempo, de colunas aleatórias para suas posições finais.
+
+    A função retorna imediatamente; os quadros são agendados no laço de eventos do Tk.
 
     Args:
         canvas: Widget Canvas do Tkinter onde o tabuleiro será desenhado.
         chromosome: Objeto Chromosome que representa a solução.
         N: Tamanho do tabuleiro (N x N).
+        viewport: BoardViewport do tabuleiro (opcional). Se informado, só as rainhas da região
+            visível são animadas, com a aproximação atual.
+        duration: Duração total da animação, em segundos.
+        fps: Quadros por segundo desejados.
+        frame_budget: Tempo máximo, em segundos, de um quadro antes de a animação saltar para o fim.
+        on_done: Função chamada quando a animação termina.
+
+    Returns:
+        Objeto QueenAnimation, que permite pular (skip) ou cancelar (cancel) a animação.
     """
-    tile_size = calculate_tile_size(canvas, N)
-    queens = []
-
-    # Inicializa as rainhas em posições aleatórias
-    for row in range(8):
-        initial_col = random.randint(0, N-1)
-        color = QUEEN_COLORS[row % len(QUEEN_COLORS)]
-        queen = canvas.create_oval(
-            initial_col * tile_size + 10,
-            row * tile_size + 10,
-            initial_col * tile_size + tile_size - 10,
-            row * tile_size + tile_size - 10,
-            fill=color
-        )
-        queens.append((row, initial_col, queen))
-
-    canvas.update()
-
-    # Move cada rainha para sua posição final
-    for row, initial_col, queen in queens:
-        final_col = chromosome.genes[row]
-        dx = (final_col - initial_col) * tile_size
-        steps = 20
-        delay = 0.02  # Tempo entre passos em segundos
-
-        for step in range(steps):
-            canvas.move(queen, dx / steps, 0)
-            canvas.update()
-            time.sleep(delay)
+    genes = chromosome.genes
+    if viewport is None:
+        tile_size = calculate_tile_size(canvas, N)
+        first_row, first_col, visible = 0, 0, N
+    else:
+        tile_size = viewport.tile_size
+        first_row, first_col, visible = viewport.row, viewport.col, viewport.visible_cells()
+
+    moves = []
+    for row in range(first_row, min(first_row + visible, len(genes))):
+        final_col = genes[row] - first_col
+        if 0 <= final_col < visible:
+            moves.append((row - first_row, random.randrange(visible), final_col))
+    return QueenAnimation(canvas, moves, tile_size, duration, fps, frame_budget, on_done).start()
 
 def print_board_tkinter(chromosome, N, text_widget):
     """
@@ -103,7 +384,16 @@ def print_board_tkinter(chromosome, N, text_widget):
         text_widget: Widget Text do Tkinter onde a solução será exibida.
     """
     text_widget.insert(tk.END, "\nSolução Encontrada:\n\n")
-    for row in range(8):
+    if N > MAX_PRINTED_BOARD_SIZE:
+        # Tabuleiros grandes são listados como colunas por linha, de forma resumida
+        genes = chromosome.genes
+        for row in range(min(len(genes), MAX_PRINTED_BOARD_SIZE)):
+            text_widget.insert(tk.END, f"Rainha {row + 1}: Coluna {genes[row] + 1}\n")
+        if len(genes) > MAX_PRINTED_BOARD_SIZE:
+            text_widget.insert(tk.END, f"... ({len(genes) - MAX_PRINTED_BOARD_SIZE} rainhas omitidas)\n")
+        text_widget.insert(tk.END, "\n")
+        return
+    for row in range(len(chromosome.genes)):
         line = ['.'] * N
         line[chromosome.genes[row]] = 'Q'
         text_widget.insert(tk.END, " ".join(line) + "\n")
@@ -120,11 +410,18 @@ def find_conflicting_queens(chromosome, N):
     Returns:
         Lista de tuplas representando pares de rainhas em conflito.
     """
-    conflicts = []
-    for i in range(8):
-        for j in range(i + 1, 8):
-            if chromosome.genes[i] == chromosome.genes[j]:
-                conflicts.append(((i + 1, chromosome.genes[i] + 1), (j + 1, chromosome.genes[j] + 1)))
-            elif abs(chromosome.genes[i] - chromosome.genes[j]) == abs(i - j):
-                conflicts.append(((i + 1, chromosome.genes[i] + 1), (j + 1, chromosome.genes[j] + 1)))
-    return conflicts
+    # Agrupa as rainhas por coluna, diagonal e anti-diagonal em uma única passada,
+    # de modo que o custo seja linear no número de rainhas mais o número de pares em conflito
+    groups = {}
+    for row, col in enumerate(chromosome.genes):
+        for key in (("col", col), ("diag", row - col), ("anti", row + col)):
+            groups.setdefault(key, []).append(row)
+
+    pairs = set()
+    for rows in groups.values():
+        for a in range(len(rows)):
+            for b in range(a + 1, len(rows)):
+                pairs.add((rows[a], rows[b]))
+
+    genes = chromosome.genes
+    return [((i + 1, genes[i] + 1), (j + 1, genes[j] + 1)) for i, j in sorted(pairs)]
@@ -0,0 +1,195 @@
+import multiprocessing
+import queue
+from genetic_algorithm import Chromosome, GeneticAlgorithm, spawn_seeds
+from progress import SilentProgress
+
+TOPOLOGIES = ("ring", "fully_connected")
+# Intervalo, em segundos, entre as verificações de ilhas encerradas enquanto o resultado é aguardado
+RESULT_POLL_INTERVAL = 0.5
+
+def migration_targets(index, islands, topology):
+    """
+    Define para quais ilhas uma ilha envia seus migrantes.
+
+    Args:
+        index: Índice da ilha de origem.
+        islands: Número total de ilhas.
+        topology: "ring" (envia para a próxima ilha) ou "fully_connected" (envia para todas).
+
+    Returns:
+        Lista de índices das ilhas de destino.
+    """
+    if islands < 2:
+        return []
+    if topology == "ring":
+        return [(index + 1) % islands]
+    if topology == "fully_connected":
+        return [other for other in range(islands) if other != index]
+    raise ValueError(f"Topologia desconhecida: {topology}")
+
+def _run_island(index, params, seed, targets, migration_interval, migration_size, inboxes, stop_event, results):
+    """
+    Executa uma ilha em um processo separado.
+
+    Args:
+        index: Índice desta ilha.
+        params: Parâmetros do GeneticAlgorithm da ilha.
+        seed: Semente do fluxo aleatório próprio da ilha.
+        targets: Índices das ilhas que recebem os migrantes desta ilha.
+        migration_interval: Número de gerações entre migrações.
+        migration_size: Número de elites enviados em cada migração.
+        inboxes: Filas de entrada de migrantes, uma por ilha.
+        stop_event: Evento compartilhado que sinaliza o fim de todas as ilhas.
+        results: Fila onde o resultado da ilha é publicado.
+    """
+    # Migrantes não entregues ao final da execução podem ser descartados
+    for inbox in inboxes:
+        inbox.cancel_join_thread()
+    ga = GeneticAlgorithm(**params, seed=seed, history_size=1, progress=SilentProgress())
+    # A ilha para assim que outra encontra a solução (cancelamento cooperativo)
+    for snapshot in ga.iter_run(cancel=stop_event):
+        # Condição de parada: solução sem conflitos interrompe todas as ilhas
+        if snapshot.solved:
+            stop_event.set()
+            break
+
+        if snapshot.generation % migration_interval == 0:
+            # Envia os melhores cromossomos (já calculados no elitismo) para as ilhas vizinhas
+            emigrants = [list(c.genes) for c in ga.elites[:migration_size]]
+            for target in targets:
+                inboxes[target].put(emigrants)
+
+            # Recebe os migrantes que já chegaram, sem bloquear
+            while True:
+                try:
+                    ga.receive_migrants(inboxes[index].get_nowait())
+                except queue.Empty:
+                    break
+
+    results.put((index, list(ga.best_chromosome.genes), ga.best_chromosome.conflicts, ga.generation))
+
+class IslandModel:
+    def __init__(self, N, islands=4, population_size=400, mutation_prob=0.05, crossover_prob=0.8, generations=1000,
+                 elite_size=5, migration_interval=10, migration_size=None, topology="ring", seed=None):
+        """
+        Inicializa o modelo de ilhas, com um Algoritmo Genético por processo.
+
+        Args:
+            N: Tamanho do tabuleiro (N x N).
+            islands: Número de ilhas (processos).
+            population_size: Tamanho total da população, dividido igualmente entre as ilhas.
+            mutation_prob: Probabilidade de mutação de um cromossomo.
+            crossover_prob: Probabilidade de realizar crossover entre dois pais.
+            generations: Número máximo de gerações de cada ilha.
+            elite_size: Número de melhores cromossomos preservados em cada geração.
+            migration_interval: Número de gerações entre migrações.
+            migration_size: Número de elites enviados em cada migração (padrão: elite_size).
+            topology: Topologia de migração, "ring" ou "fully_connected".
+            seed: Semente da qual são derivados os fluxos aleatórios independentes de cada ilha.
+                Como as migrações chegam de forma assíncrona, a mesma semente fixa as populações
+                iniciais e os sorteios, mas não garante o mesmo resultado.
+        """
+        if topology not in TOPOLOGIES:
+            raise ValueError(f"Topologia desconhecida: {topology}")
+        if islands < 1:
+            raise ValueError("O número de ilhas deve ser pelo menos 1.")
+        if migration_interval < 1:
+            raise ValueError("O intervalo entre migrações deve ser pelo menos 1 geração.")
+        if migration_size is not None and migration_size < 1:
+            raise ValueError("O número de migrantes deve ser pelo menos 1.")
+        self.N = N
+        self.islands = islands
+        self.island_population_size = max(population_size // islands, elite_size + 1)
+        self.mutation_prob = mutation_prob
+        self.crossover_prob = crossover_prob
+        self.generations = generations
+        self.elite_size = elite_size
+        self.migration_interval = migration_interval
+        self.migration_size = min(migration_size or elite_size, elite_size)
+        self.topology = topology
+        self.seed = seed
+        self.island_results = []
+        self.best_chromosome = None
+
+    def run(self):
+        """
+        Executa todas as ilhas em paralelo e retorna o melhor cromossomo encontrado.
+
+        Returns:
+            Objeto Chromosome com a melhor solução entre todas as ilhas.
+        """
+        params = dict(
+            N=self.N,
+            population_size=self.island_population_size,
+            mutation_prob=self.mutation_prob,
+            crossover_prob=self.crossover_prob,
+            generations=self.generations,
+            elite_size=self.elite_size,
+        )
+        inboxes = [multiprocessing.Queue() for _ in range(self.islands)]
+        results = multiprocessing.Queue()
+        stop_event = multiprocessing.Event()
+
+        # Cada ilha recebe um fluxo aleatório próprio, em vez de herdar o estado do processo pai
+        seeds = spawn_seeds(self.seed, self.islands)
+        processes = []
+        for index in range(self.islands):
+            process = multiprocessing.Process(
+                target=_run_island,
+                args=(index, params, seeds[index], migration_targets(index, self.islands, self.topology),
+                      self.migration_interval, self.migration_size, inboxes, stop_event, results),
+                daemon=True,
+            )
+            process.start()
+            processes.append(process)
+
+        # Os resultados são lidos antes do join para não bloquear os processos na fila
+        try:
+            self.island_results = self._collect_results(processes, results)
+        except RuntimeError:
+            stop_event.set()
+            for process in processes:
+                process.terminate()
+            raise
+        finally:
+            for process in processes:
+                process.join()
+
+        self.island_results.sort(key=lambda r: r["island"])
+        best = min(self.island_results, key=lambda r: r["conflicts"])
+        self.best_chromosome = Chromosome(best["genes"], self.N)
+        return self.best_chromosome
+
+    def _collect_results(self, processes, results):
+        """
+        Lê o resultado publicado por cada ilha, verificando periodicamente se alguma terminou sem publicá-lo.
+
+        Args:
+            processes: Processos das ilhas, na ordem dos índices.
+            results: Fila onde as ilhas publicam seus resultados.
+
+        Returns:
+            Lista de dicionários com o resultado de cada ilha.
+
+        Raises:
+            RuntimeError: Se uma ilha terminar sem publicar o resultado.
+        """
+        collected = []
+        pending = set(range(len(processes)))
+        suspects = set()
+        while pending:
+            try:
+                index, genes, conflicts, generation = results.get(timeout=RESULT_POLL_INTERVAL)
+            except queue.Empty:
+                # O resultado de uma ilha recém-encerrada pode ainda estar a caminho na fila,
+                # então ela só é considerada perdida após um segundo intervalo sem notícias
+                finished = {index for index in pending if processes[index].exitcode is not None}
+                lost = finished & suspects
+                if lost:
+                    index = min(lost)
+                    raise RuntimeError(f"A ilha {index} terminou (código {processes[index].exitcode}) sem publicar um resultado.")
+                suspects = finished
+                continue
+            pending.discard(index)
+            collected.append({"island": index, "genes": genes, "conflicts": conflicts, "generations": generation})
+        return collected
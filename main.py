@@ -1,15 +1,35 @@
+import os
 import tkinter as tk
 from tkinter import ttk, messagebox
 from genetic_algorithm import GeneticAlgorithm
+from progress import SilentProgress
 from helpers import draw_board_tkinter, animate_solution, print_board_tkinter, find_conflicting_queens
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
+import queue
+
+# Abaixo deste tamanho de casa (em pixels) as rainhas são desenhadas sem animação
+MIN_ANIMATED_TILE_SIZE = 20
+
+# Taxa padrão (quadros por segundo) com que o progresso do algoritmo é desenhado na interface
+PROGRESS_FPS = 20
+
+# Variável de ambiente que faz a janela fechar logo após abrir (usada por startup_time.py)
+EXIT_AFTER_STARTUP_ENV = "NQUEENS_EXIT_AFTER_STARTUP"
 
 class NQueensGUI:
-    def __init__(self, root):
+    def __init__(self, root, fps=PROGRESS_FPS):
         self.root = root
+        # Eventos de progresso enviados pela thread do algoritmo e consumidos pela thread da interface
+        self.progress_queue = queue.Queue()
+        self.frame_interval = max(1, 1000 // fps)  # Intervalo entre atualizações da interface (ms)
+        self.plot_generations = []
+        self.plot_conflicts = []
+        self.viewport = None  # Controla o desenho do tabuleiro (ver helpers.BoardViewport)
+        self.cancel_event = threading.Event()  # Sinaliza à thread do algoritmo que a execução deve parar
+        self.animation = None  # Animação da solução em andamento (ver helpers.QueenAnimation)
         self.root.title("Algoritmo Genético - Problema das 8-Rainhas em Tabuleiro N x N")
+        # Esc pula a animação da solução
+        self.root.bind("<Escape>", lambda event: self.skip_animation())
 
         # Configuração do layout usando grid
         self.root.columnconfigure(0, weight=1)
@@ -67,7 +87,11 @@ class NQueensGUI:
 
         # Botão para iniciar o Algoritmo Genético
         self.start_button = ttk.Button(control_frame, text="Iniciar Algoritmo", command=self.start_algorithm)
-        self.start_button.grid(row=6, column=0, columnspan=2, pady=10)
+        self.start_button.grid(row=6, column=0, pady=10)
+
+        # Botão para interromper o Algoritmo Genético em execução
+        self.stop_button = ttk.Button(control_frame, text="Parar", command=self.stop_algorithm, state=tk.DISABLED)
+        self.stop_button.grid(row=6, column=1, pady=10)
 
         # Botão About
         self.about_button = ttk.Button(control_frame, text="About", command=self.show_about)
@@ -94,14 +118,31 @@ class NQueensGUI:
         graph_frame = ttk.Frame(self.root, padding="10")
         graph_frame.grid(row=2, column=1, sticky="NSEW")
         graph_frame.columnconfigure(0, weight=1)
-        graph_frame.rowconfigure(0, weight=1)
-        self.figure, self.ax = plt.subplots(figsize=(5, 2.5))  # Diminuindo o tamanho do gráfico
+        graph_frame.rowconfigure(0, weight=1, minsize=250)  # Reserva o espaço do gráfico antes de ele ser criado
+        # O gráfico (e o matplotlib) só é criado no primeiro desenho, para a janela abrir mais rápido
+        self.graph_frame = graph_frame
+        self.figure = None
+        self.ax = None
+        self.line = None
+        self.canvas_fig = None
+
+    def ensure_plot(self):
+        """
+        Importa o matplotlib e cria o gráfico de progresso, na primeira vez em que é chamado.
+        """
+        if self.figure is not None:
+            return
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.figure = Figure(figsize=(5, 2.5))  # Diminuindo o tamanho do gráfico
+        self.ax = self.figure.add_subplot()
         self.ax.set_title("Progresso do Algoritmo Genético")
         self.ax.set_xlabel("Geração")
         self.ax.set_ylabel("Número de Conflitos")
         self.ax.grid(True)
         self.line, = self.ax.plot([], [], 'r-')
-        self.canvas_fig = FigureCanvasTkAgg(self.figure, master=graph_frame)
+        self.canvas_fig = FigureCanvasTkAgg(self.figure, master=self.graph_frame)
         self.canvas_fig.draw()
         self.canvas_fig.get_tk_widget().grid(row=0, column=0, sticky="NSEW")
 
@@ -151,34 +192,51 @@ class NQueensGUI:
             # Ajustar o tamanho do Canvas baseado em N (limite máximo de tamanho)
             max_canvas_size = 600
             tile_size = calculate_tile_size(self.canvas, self.N, max_canvas_size)
-            canvas_size = tile_size * self.N
+            canvas_size = round(tile_size * self.N)
             self.canvas.config(width=canvas_size, height=canvas_size)
 
-            # Desenhar o tabuleiro inicial
-            draw_board_tkinter(self.canvas, self.N)
+            # Interromper a animação da execução anterior, se ainda estiver em andamento
+            if self.animation is not None:
+                self.animation.cancel()
+                self.animation = None
+
+            # Desenhar o tabuleiro inicial (roda do mouse aproxima, arrastar desloca)
+            self.viewport = draw_board_tkinter(self.canvas, self.N)
+            self.viewport.bind()
 
             # Limpar gráfico e texto
-            self.ax.cla()
-            self.ax.set_title("Progresso do Algoritmo Genético")
-            self.ax.set_xlabel("Geração")
-            self.ax.set_ylabel("Número de Conflitos")
-            self.ax.grid(True)
-            self.line, = self.ax.plot([], [], 'r-')
-            self.canvas_fig.draw()
+            self.plot_generations = []
+            self.plot_conflicts = []
+            if self.line is not None:
+                self.line.set_data(self.plot_generations, self.plot_conflicts)
+                self.ax.relim()
+                self.ax.autoscale_view()
+                self.canvas_fig.draw_idle()
 
             self.text_widget.delete("1.0", tk.END)
             self.text_widget.insert(tk.END, "Detalhes das Gerações:\n\n")
 
             # Desabilitar o botão enquanto o algoritmo está rodando
             self.start_button.config(state=tk.DISABLED)
+            self.stop_button.config(state=tk.NORMAL)
 
-            # Executar o algoritmo genético em uma nova thread
-            thread = threading.Thread(target=self.run_genetic_algorithm)
+            # Executar o algoritmo genético em uma nova thread; a interface consome o progresso pela fila
+            self.progress_queue = queue.Queue()
+            self.cancel_event = threading.Event()
+            thread = threading.Thread(target=self.run_genetic_algorithm, daemon=True)
             thread.start()
+            self.root.after(self.frame_interval, self.process_progress)
 
         except ValueError:
             messagebox.showerror("Erro", "Por favor, insira valores válidos para todos os parâmetros.")
 
+    def stop_algorithm(self):
+        """
+        Pede à thread do algoritmo que pare ao fim da geração atual.
+        """
+        self.cancel_event.set()
+        self.stop_button.config(state=tk.DISABLED)
+
     def run_genetic_algorithm(self):
         # Instanciar o Algoritmo Genético
         ga = GeneticAlgorithm(
@@ -187,40 +245,76 @@ class NQueensGUI:
             mutation_prob=self.mutation_prob,
             crossover_prob=self.crossover_prob,
             generations=self.generations,
-            elite_size=self.elite_size
+            elite_size=self.elite_size,
+            # O progresso é exibido na própria interface
+            progress=SilentProgress()
         )
 
-        # Função de callback para atualizar a GUI após cada geração
+        # Função de callback executada na thread do algoritmo: apenas enfileira o progresso,
+        # sem tocar nos widgets do Tk
         def callback(generation, fitness, conflicts):
-            # Atualizar gráfico
-            self.ax.cla()
-            self.ax.set_title("Progresso do Algoritmo Genético")
-            self.ax.set_xlabel("Geração")
-            self.ax.set_ylabel("Número de Conflitos")
-            self.ax.grid(True)
-            self.ax.plot(range(1, generation + 1), ga.conflicts_history, 'r-')
-            self.canvas_fig.draw()
-
-            # Atualizar o console de solução com detalhes por geração
-            self.text_widget.insert(tk.END, f"Geração {generation}: Melhor Aptidão = {fitness:.4f}, Conflitos = {conflicts}\n")
+            self.progress_queue.put(("progress", generation, fitness, conflicts))
+
+        # Executar o Algoritmo Genético até o fim ou até o botão Parar ser pressionado
+        best_solution = ga.run(callback=callback, cancel=self.cancel_event)
+        self.progress_queue.put(("done", best_solution, ga.stop_reason))
+
+    def process_progress(self):
+        """
+        Consome os eventos de progresso acumulados e atualiza a interface uma vez por quadro.
+        """
+        lines = []
+        best_solution = None
+        stop_reason = None
+        while True:
+            try:
+                event = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            if event[0] == "done":
+                _, best_solution, stop_reason = event
+                break
+            _, generation, fitness, conflicts = event
+            self.plot_generations.append(generation)
+            self.plot_conflicts.append(conflicts)
+            lines.append(f"Geração {generation}: Melhor Aptidão = {fitness:.4f}, Conflitos = {conflicts}\n")
+
+        if lines:
+            # Atualizar gráfico sem redesenhar os eixos do zero
+            self.ensure_plot()
+            self.line.set_data(self.plot_generations, self.plot_conflicts)
+            self.ax.relim()
+            self.ax.autoscale_view()
+            self.canvas_fig.draw_idle()
+
+            # Atualizar o console de solução com todas as gerações do quadro de uma vez
+            self.text_widget.insert(tk.END, "".join(lines))
             self.text_widget.see(tk.END)
 
-        # Executar o Algoritmo Genético
-        best_solution = ga.run(callback=callback)
+        if best_solution is None:
+            self.root.after(self.frame_interval, self.process_progress)
+        else:
+            self.show_result(best_solution, stop_reason)
 
-        # Atualizar o gráfico final
-        self.ax.cla()
-        self.ax.set_title("Progresso do Algoritmo Genético")
-        self.ax.set_xlabel("Geração")
-        self.ax.set_ylabel("Número de Conflitos")
-        self.ax.grid(True)
-        self.ax.plot(range(1, len(ga.conflicts_history) + 1), ga.conflicts_history, 'r-')
-        self.canvas_fig.draw()
+    def show_result(self, best_solution, stop_reason=None):
+        """
+        Exibe o resultado final do algoritmo na interface.
 
+        Args:
+            best_solution: Objeto Chromosome com a melhor solução encontrada.
+            stop_reason: Motivo do fim da execução (ver GeneticAlgorithm.stop_reason).
+        """
+        self.stop_button.config(state=tk.DISABLED)
         # Verificar se a solução é válida
         if best_solution.conflicts == 0:
-            # Animar a solução encontrada
-            animate_solution(self.canvas, best_solution, self.N)
+            if self.viewport.tile_size >= MIN_ANIMATED_TILE_SIZE:
+                # Animar a solução encontrada sem bloquear a interface; as rainhas ficam
+                # registradas para redesenhos ao aproximar
+                self.viewport.genes = best_solution.genes
+                self.animation = animate_solution(self.canvas, best_solution, self.N, viewport=self.viewport)
+            else:
+                # Tabuleiros grandes: desenhar apenas as rainhas visíveis
+                self.viewport.set_genes(best_solution.genes)
 
             # Exibir a solução no console
             print_board_tkinter(best_solution, self.N, self.text_widget)
@@ -231,21 +325,33 @@ class NQueensGUI:
             for (queen1, queen2) in conflicts:
                 conflict_msg += f"Rainha {queen1[0]} (Coluna {queen1[1]}) <--> Rainha {queen2[0]} (Coluna {queen2[1]})\n"
 
+            if stop_reason == "cancelled":
+                conflict_msg = "Execução interrompida pelo usuário.\n\n" + conflict_msg
+
             # Exibir a mensagem no widget Text
             self.text_widget.insert(tk.END, conflict_msg)
             self.text_widget.see(tk.END)
 
-            # Exibir uma mensagem de aviso na GUI
-            messagebox.showwarning("Aviso", "Não foi possível encontrar uma solução válida com os parâmetros fornecidos.\n"
-                                            "Considere ajustar os parâmetros e tentar novamente.")
+            # Exibir uma mensagem de aviso na GUI (exceto quando o próprio usuário interrompeu)
+            if stop_reason != "cancelled":
+                messagebox.showwarning("Aviso", "Não foi possível encontrar uma solução válida com os parâmetros fornecidos.\n"
+                                                "Considere ajustar os parâmetros e tentar novamente.")
 
         # Reabilitar o botão
         self.start_button.config(state=tk.NORMAL)
 
+    def skip_animation(self):
+        """
+        Leva as rainhas animadas direto às posições finais.
+        """
+        if self.animation is not None:
+            self.animation.skip()
+
     def on_closing(self):
         """
         Função para lidar com o fechamento da janela.
         """
+        self.cancel_event.set()
         self.root.destroy()
 
 def calculate_tile_size(canvas, N, max_size):
@@ -258,8 +364,10 @@ def calculate_tile_size(canvas, N, max_size):
         max_size: Tamanho máximo do canvas em pixels.
 
     Returns:
-        Tamanho do tile em pixels.
+        Tamanho do tile em pixels (fracionário quando N é maior que max_size).
     """
+    if N > max_size:
+        return max_size / N
     tile_size = max_size // N
     return tile_size
 
@@ -267,6 +375,9 @@ def main():
     root = tk.Tk()
     app = NQueensGUI(root)
     root.protocol("WM_DELETE_WINDOW", app.on_closing)
+    if os.environ.get(EXIT_AFTER_STARTUP_ENV):
+        # Fecha assim que a janela é desenhada, para medir o tempo de inicialização
+        root.after_idle(app.on_closing)
     root.mainloop()
 
 if __name__ == "__main__":
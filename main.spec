@@ -1,5 +1,26 @@
 # -*- mode: python ; coding: utf-8 -*-
 
+# Módulos que a interface não usa: ferramentas de empacotamento, testes, outros backends
+# gráficos e os módulos do projeto que só servem à linha de comando. Excluí-los reduz o
+# executável e o que precisa ser extraído e importado na inicialização.
+EXCLUDES = [
+    # Ferramentas de empacotamento e testes (unittest fica: o pyparsing, usado pelo matplotlib, o importa)
+    'setuptools', 'pkg_resources', '_distutils_hack', 'distutils', 'pip', 'pydoc', 'pydoc_data',
+    'doctest', 'lib2to3', 'test', 'numpy.testing', 'numpy.f2py', 'numpy.distutils',
+    # Rede e serviços
+    'http', 'xmlrpc', 'urllib3', 'certifi', 'ftplib',
+    # Backends gráficos e toolkits que não são Tk
+    'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'wx', 'gi', 'cairo', 'IPython', 'jupyter',
+    'matplotlib.backends.backend_qt', 'matplotlib.backends.backend_qtagg', 'matplotlib.backends.backend_qtcairo',
+    'matplotlib.backends.backend_wx', 'matplotlib.backends.backend_wxagg', 'matplotlib.backends.backend_gtk3',
+    'matplotlib.backends.backend_gtk4', 'matplotlib.backends.backend_webagg', 'matplotlib.backends.backend_nbagg',
+    'matplotlib.backends.backend_pdf', 'matplotlib.backends.backend_pgf', 'matplotlib.backends.backend_ps',
+    'matplotlib.backends.backend_svg', 'PIL.ImageQt',
+    # Módulos do projeto usados apenas sem interface
+    'cli', 'sweep', 'service', 'island_model', 'numpy_genetic_algorithm', 'exact_solver', 'checkpoint',
+    'startup_time', 'asyncio', 'multiprocessing', 'concurrent',
+]
+
 
 a = Analysis(
     ['main.py'],
@@ -10,9 +31,9 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=EXCLUDES,
     noarchive=False,
-    optimize=0,
+    optimize=1,
 )
 pyz = PYZ(a.pure)
 
@@ -26,7 +47,7 @@ exe = EXE(
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
+    upx=False,  # Executáveis comprimidos com UPX são descomprimidos a cada inicialização
     upx_exclude=[],
     runtime_tmpdir=None,
     console=False,
@@ -0,0 +1,200 @@
+from collections import deque
+import numpy as np
+from genetic_algorithm import Chromosome
+from progress import PrintProgress
+
+class NumpyGeneticAlgorithm:
+    def __init__(self, N, population_size=100, mutation_prob=0.05, crossover_prob=0.8, generations=1000, elite_size=5, seed=None,
+                 progress=None, history_size=None):
+        """
+        Inicializa o Algoritmo Genético vetorizado para o problema das 8-Rainhas em um tabuleiro N x N.
+
+        A população inteira é um único array 2D de inteiros (população x 8) e a aptidão,
+        a seleção, o crossover e a mutação são executados em lote a cada geração.
+
+        Args:
+            N: Tamanho do tabuleiro (N x N).
+            population_size: Número de cromossomos na população.
+            mutation_prob: Probabilidade de mutação de cada gene.
+            crossover_prob: Probabilidade de realizar crossover entre dois pais.
+            generations: Número máximo de gerações a serem executadas.
+            elite_size: Número de melhores cromossomos preservados em cada geração.
+            seed: Semente opcional do gerador de números aleatórios do NumPy.
+            progress: Destino do progresso por geração (ver progress.py); padrão: imprime toda geração.
+            history_size: Se definido, conflicts_history guarda apenas as últimas history_size gerações.
+        """
+        self.N = N  # Tamanho do tabuleiro (N x N)
+        self.population_size = population_size
+        self.mutation_prob = mutation_prob
+        self.crossover_prob = crossover_prob
+        self.generations = generations
+        self.elite_size = min(elite_size, population_size)
+        self.rng = np.random.default_rng(seed)
+
+        # Pares de linhas (i, j) com i < j, usados no cálculo vetorizado de conflitos
+        rows_i, rows_j = np.triu_indices(8, k=1)
+        self._pair_i = rows_i
+        self._pair_j = rows_j
+        self._pair_distance = rows_j - rows_i
+
+        self.population = self.create_initial_population()
+        self.conflicts = self.calculate_conflicts(self.population)
+        self.fitness = 1 / (1 + self.conflicts)
+        best = int(np.argmax(self.fitness))
+        self.best_genes = self.population[best].copy()
+        self.best_conflicts = int(self.conflicts[best])
+        self.best_chromosome = Chromosome(self.best_genes.tolist(), self.N)
+        self.no_improvement = 0
+        self.progress = progress if progress is not None else PrintProgress()
+        # Para plotagem do progresso; com history_size, funciona como um buffer circular
+        self.conflicts_history = deque(maxlen=history_size) if history_size else []
+
+    def create_initial_population(self):
+        """
+        Gera uma população inicial aleatória.
+
+        Returns:
+            Array (população x 8) com a coluna de cada rainha.
+        """
+        return self.rng.integers(0, self.N, size=(self.population_size, 8), dtype=np.int32)
+
+    def calculate_conflicts(self, population):
+        """
+        Calcula o número de conflitos de todos os cromossomos de uma vez.
+
+        Args:
+            population: Array (população x 8) de genes.
+
+        Returns:
+            Array com o número de conflitos de cada cromossomo.
+        """
+        diff = np.abs(population[:, self._pair_i] - population[:, self._pair_j])
+        # Conflito na mesma coluna (diff == 0) ou na diagonal (diff == distância entre linhas)
+        clashes = (diff == 0) | (diff == self._pair_distance)
+        return clashes.sum(axis=1)
+
+    def roulette_selection(self, n):
+        """
+        Seleciona n índices de pais usando o método de roleta.
+
+        Args:
+            n: Número de pais a selecionar.
+
+        Returns:
+            Array com os índices selecionados.
+        """
+        selection_probs = self.fitness / self.fitness.sum()
+        return self.rng.choice(self.population_size, size=n, p=selection_probs)
+
+    def tournament_selection(self, n, k=3):
+        """
+        Seleciona n índices de pais pelo método de torneio.
+
+        Args:
+            n: Número de pais a selecionar.
+            k: Número de cromossomos a participar de cada torneio.
+
+        Returns:
+            Array com os índices selecionados.
+        """
+        contestants = self.rng.integers(0, self.population_size, size=(n, k))
+        winners = np.argmax(self.fitness[contestants], axis=1)
+        return contestants[np.arange(n), winners]
+
+    def crossover(self, parents1, parents2):
+        """
+        Realiza o crossover de dois pontos entre pares de pais.
+
+        Args:
+            parents1: Array (filhos x 8) com os genes dos primeiros pais.
+            parents2: Array (filhos x 8) com os genes dos segundos pais.
+
+        Returns:
+            Array (filhos x 8) com os genes dos filhos.
+        """
+        n = parents1.shape[0]
+        # Escolher dois pontos distintos de crossover para cada filho
+        first = self.rng.integers(0, 8, size=n)
+        second = self.rng.integers(0, 7, size=n)
+        second += second >= first
+        start = np.minimum(first, second)
+        end = np.maximum(first, second)
+
+        positions = np.arange(8)
+        segment = (positions >= start[:, None]) & (positions <= end[:, None])
+        segment &= (self.rng.random(n) < self.crossover_prob)[:, None]
+        return np.where(segment, parents2, parents1)
+
+    def mutate(self, children):
+        """
+        Aplica mutação aos filhos trocando a coluna de rainhas sorteadas.
+
+        Args:
+            children: Array (filhos x 8) a ser mutado no próprio lugar.
+        """
+        mask = self.rng.random(children.shape) < self.mutation_prob
+        children[mask] = self.rng.integers(0, self.N, size=int(mask.sum()), dtype=children.dtype)
+
+    def evolve_population(self):
+        """
+        Evolui a população para a próxima geração.
+        """
+        # Elitismo: preserva os melhores cromossomos
+        elite_idx = np.argsort(-self.fitness, kind="stable")[:self.elite_size]
+        n_children = self.population_size - self.elite_size
+
+        # Geração dos novos indivíduos
+        parents1 = self.population[self.tournament_selection(n_children)]
+        parents2 = self.population[self.roulette_selection(n_children)]
+        children = self.crossover(parents1, parents2)
+        self.mutate(children)
+
+        # Atualiza a população
+        self.population = np.concatenate((self.population[elite_idx], children))
+        self.conflicts = np.concatenate((self.conflicts[elite_idx], self.calculate_conflicts(children)))
+        self.fitness = 1 / (1 + self.conflicts)
+        self.update_best_chromosome()
+
+    def update_best_chromosome(self):
+        """
+        Atualiza o melhor cromossomo encontrado.
+        """
+        current = int(np.argmax(self.fitness))
+        if self.conflicts[current] < self.best_conflicts:
+            self.best_genes = self.population[current].copy()
+            self.best_conflicts = int(self.conflicts[current])
+            self.best_chromosome = Chromosome(self.best_genes.tolist(), self.N)
+            self.no_improvement = 0
+        else:
+            self.no_improvement += 1
+            if self.no_improvement >= 100:
+                # Aumenta a taxa de mutação para promover diversidade
+                self.mutation_prob = min(self.mutation_prob * 1.1, 0.5)
+
+    def run(self, callback=None):
+        """
+        Executa o algoritmo genético e retorna o melhor cromossomo encontrado.
+
+        Args:
+            callback: Função a ser chamada após cada geração, para atualizar a GUI.
+
+        Returns:
+            Objeto Chromosome com a melhor solução.
+        """
+        for generation in range(1, self.generations + 1):
+            self.evolve_population()
+            best = self.best_chromosome
+            self.conflicts_history.append(best.conflicts)
+            self.progress.generation(generation, best.fitness, best.conflicts, self)
+
+            # Chama o callback para atualizar a GUI
+            if callback:
+                callback(generation, best.fitness, best.conflicts)
+
+            # Condição de parada: solução sem conflitos
+            if best.conflicts == 0:
+                self.progress.solution_found(generation, self)
+                break
+
+        self.progress.flush()
+        return self.best_chromosome
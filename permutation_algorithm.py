@@ -0,0 +1,356 @@
+from array import array
+from genetic_algorithm import Chromosome, GeneticAlgorithm, gene_typecode, random_pair
+
+GREEDY_ATTEMPTS = 64  # Tentativas por linha na construção gulosa da população inicial
+SWAP_CANDIDATES = 64  # Trocas testadas por passo da busca local
+
+class PermutationChromosome(Chromosome):
+    __slots__ = ()
+    def __init__(self, genes, N, conflicts=None):
+        """
+        Inicializa um cromossomo codificado como permutação: N rainhas em um tabuleiro N x N.
+
+        Cada linha e cada coluna recebem exatamente uma rainha, então só há conflitos
+        nas diagonais. Os genes e os contadores de ocupação das diagonais são arrays
+        compactos de tamanho fixo.
+
+        Args:
+            genes: Permutação de 0 a N - 1 (lista ou array) com a coluna da rainha de cada linha.
+            N: Tamanho do tabuleiro (N x N).
+            conflicts: Número de conflitos já conhecido (por exemplo, vindo do cache de aptidão).
+        """
+        self.genes = genes if isinstance(genes, array) else array(gene_typecode(N), genes)
+        self.N = N
+        self.fitness = 0
+        self.conflicts = 0
+        self.diagonals = None
+        self.anti_diagonals = None
+        if conflicts is None:
+            self.calculate_fitness()
+        else:
+            self.conflicts = conflicts
+            self.fitness = 1 / (1 + conflicts)
+
+    def _ensure_counters(self):
+        """
+        Monta os contadores das diagonais se o cromossomo veio do cache sem eles.
+        """
+        if self.diagonals is None:
+            self.calculate_fitness()
+
+    def calculate_fitness(self):
+        """
+        Calcula o número de conflitos e a aptidão do cromossomo em tempo linear.
+
+        Reconstrói os contadores das diagonais principais (linha - coluna + N - 1)
+        e anti-diagonais (linha + coluna).
+        """
+        N = self.N
+        diagonals = array("I", bytes(4 * (2 * N - 1)))
+        anti_diagonals = array("I", bytes(4 * (2 * N - 1)))
+        conflicts = 0
+        for row, col in enumerate(self.genes):
+            diagonal = row - col + N - 1
+            anti_diagonal = row + col
+            conflicts += diagonals[diagonal] + anti_diagonals[anti_diagonal]
+            diagonals[diagonal] += 1
+            anti_diagonals[anti_diagonal] += 1
+        self.diagonals = diagonals
+        self.anti_diagonals = anti_diagonals
+        self.conflicts = conflicts
+        self.fitness = 1 / (1 + conflicts)
+
+    def _place(self, row, col):
+        diagonal = row - col + self.N - 1
+        anti_diagonal = row + col
+        attacked = self.diagonals[diagonal] + self.anti_diagonals[anti_diagonal]
+        self.diagonals[diagonal] += 1
+        self.anti_diagonals[anti_diagonal] += 1
+        return attacked
+
+    def _remove(self, row, col):
+        diagonal = row - col + self.N - 1
+        anti_diagonal = row + col
+        self.diagonals[diagonal] -= 1
+        self.anti_diagonals[anti_diagonal] -= 1
+        return self.diagonals[diagonal] + self.anti_diagonals[anti_diagonal]
+
+    def set_gene(self, row, col):
+        raise TypeError("Cromossomos de permutação só podem ser alterados por troca (swap).")
+
+    def swap(self, i, j):
+        """
+        Troca as colunas das rainhas das linhas i e j, atualizando os conflitos em O(1).
+
+        Args:
+            i: Primeira linha.
+            j: Segunda linha.
+        """
+        if i == j:
+            return
+        self._ensure_counters()
+        genes = self.genes
+        col_i, col_j = genes[i], genes[j]
+        self.conflicts -= self._remove(i, col_i)
+        self.conflicts -= self._remove(j, col_j)
+        genes[i], genes[j] = col_j, col_i
+        self.conflicts += self._place(i, col_j)
+        self.conflicts += self._place(j, col_i)
+        self.fitness = 1 / (1 + self.conflicts)
+
+    def is_conflicted(self, row):
+        """
+        Verifica se a rainha de uma linha é atacada por alguma outra.
+
+        Args:
+            row: Linha da rainha.
+
+        Returns:
+            True se a rainha compartilha uma diagonal com outra rainha.
+        """
+        self._ensure_counters()
+        col = self.genes[row]
+        return self.diagonals[row - col + self.N - 1] > 1 or self.anti_diagonals[row + col] > 1
+
+    def copy(self):
+        """
+        Cria uma cópia independente do cromossomo, incluindo os contadores, sem reavaliá-lo.
+        Se os contadores ainda não foram montados, a cópia também fica sem eles.
+
+        Returns:
+            Novo objeto PermutationChromosome.
+        """
+        clone = PermutationChromosome.__new__(PermutationChromosome)
+        clone.genes = array(self.genes.typecode, self.genes)
+        clone.N = self.N
+        clone.fitness = self.fitness
+        clone.conflicts = self.conflicts
+        if self.diagonals is None:
+            clone.diagonals = clone.anti_diagonals = None
+        else:
+            clone.diagonals = array("I", self.diagonals)
+            clone.anti_diagonals = array("I", self.anti_diagonals)
+        return clone
+
+    def assign(self, other):
+        """
+        Sobrescreve este cromossomo com o conteúdo de outro, reaproveitando seus arrays.
+
+        Args:
+            other: Cromossomo de origem, do mesmo tamanho de tabuleiro.
+        """
+        self.genes[:] = other.genes
+        self.N = other.N
+        self.fitness = other.fitness
+        self.conflicts = other.conflicts
+        if other.diagonals is None:
+            self.diagonals = self.anti_diagonals = None
+        elif self.diagonals is None:
+            self.diagonals = array("I", other.diagonals)
+            self.anti_diagonals = array("I", other.anti_diagonals)
+        else:
+            self.diagonals[:] = other.diagonals
+            self.anti_diagonals[:] = other.anti_diagonals
+
+def _copy_genes(genes, out):
+    if out is None:
+        return array(genes.typecode, genes)
+    out[:] = genes
+    return out
+
+def order_crossover(genes1, genes2, start, end, out=None):
+    """
+    Crossover de ordem (OX): copia genes1[start:end + 1] e completa com os genes
+    restantes na ordem em que aparecem em genes2, a partir de end + 1.
+
+    Args:
+        out: Array já alocado onde o filho é escrito (opcional).
+
+    Returns:
+        Array com a permutação do filho.
+    """
+    N = len(genes1)
+    child = _copy_genes(genes1, out)
+    used = bytearray(N)
+    for col in genes1[start:end + 1]:
+        used[col] = 1
+    position = (end + 1) % N
+    for offset in range(N):
+        col = genes2[(end + 1 + offset) % N]
+        if not used[col]:
+            child[position] = col
+            position = (position + 1) % N
+    return child
+
+def partially_mapped_crossover(genes1, genes2, start, end, out=None):
+    """
+    Crossover parcialmente mapeado (PMX): copia genes2[start:end + 1] sobre genes1 e
+    resolve as colunas repetidas seguindo o mapeamento entre os dois segmentos.
+
+    Args:
+        out: Array já alocado onde o filho é escrito (opcional).
+
+    Returns:
+        Array com a permutação do filho.
+    """
+    N = len(genes1)
+    child = _copy_genes(genes1, out)
+    # Posição de cada coluna no pai 1, mantida atualizada durante as trocas
+    position = array("I", bytes(4 * N))
+    for row, col in enumerate(genes1):
+        position[col] = row
+    for row in range(start, end + 1):
+        col = genes2[row]
+        other = position[col]
+        displaced = child[row]
+        child[row], child[other] = col, displaced
+        position[col], position[displaced] = row, other
+    return child
+
+class PermutationGeneticAlgorithm(GeneticAlgorithm):
+    chromosome_class = PermutationChromosome
+
+    def __init__(self, N, population_size=20, mutation_prob=0.05, crossover_prob=0.8, generations=1000, elite_size=2, crossover_method="ox", **options):
+        """
+        Inicializa o Algoritmo Genético com codificação por permutação para N rainhas em um tabuleiro N x N.
+
+        Args:
+            N: Tamanho do tabuleiro (N x N) e número de rainhas.
+            population_size: Número de cromossomos na população.
+            mutation_prob: Probabilidade de um filho sofrer uma mutação por troca.
+            crossover_prob: Probabilidade de realizar crossover entre dois pais.
+            generations: Número máximo de gerações a serem executadas.
+            elite_size: Número de melhores cromossomos preservados em cada geração.
+            crossover_method: "ox" (crossover de ordem) ou "pmx" (parcialmente mapeado).
+            **options: Demais opções de GeneticAlgorithm (cache de aptidão, perfilamento, progresso,
+                histórico, população inicial, busca local, diversidade, reinício parcial e semente),
+                exceto queens, que é sempre N.
+        """
+        if crossover_method not in ("ox", "pmx"):
+            raise ValueError(f"Método de crossover desconhecido: {crossover_method}")
+        self.crossover_method = crossover_method
+        super().__init__(N, population_size, mutation_prob, crossover_prob, generations, elite_size, queens=N, **options)
+
+    def random_permutation(self):
+        """
+        Gera uma permutação aleatória de forma gulosa, evitando diagonais já ocupadas.
+
+        Cada linha tenta até GREEDY_ATTEMPTS colunas livres sorteadas e fica com a primeira que não
+        ataca as rainhas anteriores. Em tabuleiros grandes isso deixa poucos conflitos
+        logo na população inicial, com custo linear.
+
+        Returns:
+            Array com a permutação.
+        """
+        N = self.N
+        genes = array(gene_typecode(N), bytes(array(gene_typecode(N)).itemsize * N))
+        free = list(range(N))
+        diagonals = bytearray(2 * N - 1)
+        anti_diagonals = bytearray(2 * N - 1)
+        randrange = self.rng.randrange
+        for row in range(N):
+            remaining = N - row
+            for _ in range(GREEDY_ATTEMPTS):
+                pick = randrange(remaining)
+                col = free[pick]
+                if not diagonals[row - col + N - 1] and not anti_diagonals[row + col]:
+                    break
+            free[pick] = free[remaining - 1]
+            genes[row] = col
+            diagonals[row - col + N - 1] = 1
+            anti_diagonals[row + col] = 1
+        return genes
+
+    def random_genes(self):
+        """
+        Returns:
+            Permutação gerada por random_permutation.
+        """
+        return self.random_permutation()
+
+    def crossover(self, parent1, parent2, child=None):
+        """
+        Realiza um crossover que preserva a permutação (OX ou PMX).
+
+        Args:
+            parent1: Cromossomo pai 1.
+            parent2: Cromossomo pai 2.
+            child: Cromossomo já alocado onde o filho é escrito (opcional).
+
+        Returns:
+            Objeto PermutationChromosome filho.
+        """
+        # Com uma única linha não há dois pontos de corte distintos
+        if self.rng.random() >= self.crossover_prob or self.N < 2:
+            if child is None:
+                return parent1.copy()
+            child.assign(parent1)
+            return child
+        start, end = random_pair(self.rng, self.N)
+        operator = order_crossover if self.crossover_method == "ox" else partially_mapped_crossover
+        if child is None:
+            return self.new_chromosome(operator(parent1.genes, parent2.genes, start, end))
+        operator(parent1.genes, parent2.genes, start, end, out=child.genes)
+        self.evaluate(child)
+        return child
+
+    def mutate(self, chromosome):
+        """
+        Aplica mutação por troca das colunas de duas rainhas.
+
+        Args:
+            chromosome: Objeto PermutationChromosome a ser mutado.
+        """
+        if self.rng.random() < self.mutation_prob and self.N > 1:
+            i, j = random_pair(self.rng, self.N)
+            chromosome.swap(i, j)
+
+    def perturb(self, chromosome):
+        """
+        Aplica uma troca obrigatória entre duas rainhas sorteadas.
+
+        Args:
+            chromosome: Objeto PermutationChromosome a ser alterado.
+        """
+        if self.N < 2:
+            return
+        i, j = random_pair(self.rng, self.N)
+        chromosome.swap(i, j)
+
+    def local_search(self, chromosome, max_steps):
+        """
+        Melhora um cromossomo por subida de encosta com trocas (min-conflicts para permutações).
+
+        A cada passo, uma rainha atacada troca de coluna com até SWAP_CANDIDATES rainhas
+        sorteadas, ficando com a primeira troca que reduz os conflitos. As rainhas atacadas
+        são listadas uma vez e a lista só é refeita quando se esgota, então cada passo custa
+        O(SWAP_CANDIDATES) mesmo em tabuleiros grandes.
+
+        Args:
+            chromosome: Cromossomo a ser melhorado no próprio lugar.
+            max_steps: Número máximo de passos.
+
+        Returns:
+            Número de passos executados.
+        """
+        N = self.N
+        candidates = min(SWAP_CANDIDATES, N - 1)
+        randrange = self.rng.randrange
+        conflicted = []
+        steps = 0
+        while steps < max_steps and chromosome.conflicts:
+            if not conflicted:
+                conflicted = [row for row in range(N) if chromosome.is_conflicted(row)]
+                self.rng.shuffle(conflicted)
+            i = conflicted.pop()
+            if not chromosome.is_conflicted(i):
+                continue
+            steps += 1
+            before = chromosome.conflicts
+            for _ in range(candidates):
+                j = randrange(N)
+                chromosome.swap(i, j)
+                if chromosome.conflicts < before:
+                    break
+                chromosome.swap(i, j)
+        return steps
@@ -0,0 +1,146 @@
+import json
+import time
+from functools import wraps
+
+# Fases medidas pelo GeneticAlgorithm quando o perfilamento está ativado
+PHASES = (
+    "generation",
+    "elitism",
+    "tournament_selection",
+    "roulette_selection",
+    "crossover",
+    "mutate",
+    "local_search",
+    "diversity",
+    "restart",
+    "calculate_fitness",
+    "callback",
+)
+
+class GAStats:
+    def __init__(self):
+        """
+        Acumula tempos e contagens por fase de um Algoritmo Genético.
+
+        Os tempos são medidos com time.perf_counter. Fases aninhadas (por exemplo, a
+        avaliação feita dentro do crossover) são contadas também na fase externa.
+        """
+        self.calls = {phase: 0 for phase in PHASES}
+        self.times = {phase: 0.0 for phase in PHASES}
+        self.evaluations = 0
+        self.generations = 0
+        self.started = time.perf_counter()
+        # Tempos por fase de cada geração, para exportação do trace
+        self.generation_records = []
+        self._generation_start = None
+        self._generation_times = None
+
+    def add(self, phase, elapsed, calls=1):
+        """
+        Registra o tempo gasto em uma fase.
+
+        Args:
+            phase: Nome da fase.
+            elapsed: Tempo gasto, em segundos.
+            calls: Número de chamadas incluídas no tempo.
+        """
+        self.calls[phase] = self.calls.get(phase, 0) + calls
+        self.times[phase] = self.times.get(phase, 0.0) + elapsed
+        if self._generation_times is not None and phase != "generation":
+            self._generation_times[phase] = self._generation_times.get(phase, 0.0) + elapsed
+
+    def wrap(self, phase, func):
+        """
+        Envolve uma função para que cada chamada seja cronometrada na fase indicada.
+
+        Args:
+            phase: Nome da fase.
+            func: Função ou método ligado a ser medido.
+
+        Returns:
+            Função com a mesma assinatura de func.
+        """
+        @wraps(func)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.add(phase, time.perf_counter() - start)
+        return timed
+
+    def start_generation(self):
+        """
+        Marca o início de uma geração.
+        """
+        self._generation_start = time.perf_counter()
+        self._generation_times = {}
+
+    def end_generation(self, evaluations):
+        """
+        Marca o fim de uma geração.
+
+        Args:
+            evaluations: Número de cromossomos avaliados na geração.
+        """
+        end = time.perf_counter()
+        self.generations += 1
+        self.evaluations += evaluations
+        self.add("generation", end - self._generation_start)
+        self.generation_records.append((self._generation_start - self.started, end - self._generation_start, self._generation_times))
+        self._generation_times = None
+
+    @property
+    def elapsed(self):
+        """
+        Tempo total, em segundos, desde a criação das estatísticas.
+        """
+        return time.perf_counter() - self.started
+
+    @property
+    def evaluations_per_second(self):
+        """
+        Cromossomos avaliados por segundo de tempo gasto nas gerações.
+        """
+        generation_time = self.times["generation"]
+        return self.evaluations / generation_time if generation_time else 0.0
+
+    def summary(self):
+        """
+        Returns:
+            Dicionário com chamadas, tempo total e tempo médio de cada fase, além dos totais.
+        """
+        phases = {
+            phase: {
+                "calls": self.calls[phase],
+                "total": self.times[phase],
+                "mean": self.times[phase] / self.calls[phase] if self.calls[phase] else 0.0,
+            }
+            for phase in self.calls
+        }
+        return {
+            "generations": self.generations,
+            "evaluations": self.evaluations,
+            "evaluations_per_second": self.evaluations_per_second,
+            "elapsed": self.elapsed,
+            "phases": phases,
+        }
+
+    def export_trace(self, path):
+        """
+        Exporta as gerações em formato Trace Event (JSON), legível em chrome://tracing ou Perfetto.
+
+        Cada geração vira um evento com sua duração e um contador com o tempo de cada fase.
+
+        Args:
+            path: Caminho do arquivo de saída.
+        """
+        events = []
+        for generation, (start, duration, phase_times) in enumerate(self.generation_records, start=1):
+            timestamp = start * 1e6
+            events.append({"name": f"Geração {generation}", "cat": "generation", "ph": "X", "pid": 0, "tid": 0,
+                           "ts": timestamp, "dur": duration * 1e6})
+            events.append({"name": "fases (ms)", "ph": "C", "pid": 0, "tid": 0, "ts": timestamp,
+                           "args": {phase: elapsed * 1e3 for phase, elapsed in phase_times.items()}})
+        with open(path, "w") as trace_file:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, trace_file)
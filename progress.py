@@ -0,0 +1,130 @@
+import json
+import sys
+import time
+
+class PrintProgress:
+    def __init__(self, every=1, stream=None):
+        """
+        Imprime o progresso do algoritmo como texto, a cada k gerações.
+
+        Args:
+            every: Intervalo, em gerações, entre as linhas impressas.
+            stream: Arquivo de saída (padrão: sys.stdout no momento da escrita).
+        """
+        if every < 1:
+            raise ValueError("O intervalo entre registros deve ser pelo menos 1.")
+        self.every = every
+        self.stream = stream
+
+    def generation(self, generation, fitness, conflicts, ga):
+        """
+        Registra o fim de uma geração.
+
+        Args:
+            generation: Número da geração.
+            fitness: Melhor aptidão encontrada até agora.
+            conflicts: Conflitos do melhor cromossomo.
+            ga: Instância do algoritmo.
+        """
+        if generation % self.every == 0:
+            print(f"Geração {generation}: Melhor Aptidão = {fitness:.4f}, Conflitos = {conflicts}", file=self.stream or sys.stdout)
+
+    def solution_found(self, generation, ga):
+        """
+        Registra que uma solução sem conflitos foi encontrada.
+
+        Args:
+            generation: Geração em que a solução foi encontrada.
+            ga: Instância do algoritmo.
+        """
+        print(f"Solução encontrada na geração {generation}!", file=self.stream or sys.stdout)
+
+    def flush(self):
+        """
+        Grava o progresso pendente. Chamado ao fim de cada execução; o destino continua
+        aberto, então o mesmo objeto pode registrar execuções seguintes do algoritmo.
+        """
+        (self.stream or sys.stdout).flush()
+
+    def close(self):
+        """
+        Libera o destino do registro. Cabe a quem criou o objeto chamá-lo, após a última execução.
+        """
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+class SilentProgress(PrintProgress):
+    def __init__(self):
+        """
+        Descarta todo o progresso do algoritmo.
+        """
+        super().__init__()
+
+    def generation(self, generation, fitness, conflicts, ga):
+        pass
+
+    def solution_found(self, generation, ga):
+        pass
+
+    def flush(self):
+        pass
+
+class JsonLinesProgress(PrintProgress):
+    def __init__(self, output, every=1, buffer_size=1000):
+        """
+        Registra o progresso como registros JSON (um por linha), gravados em lotes.
+
+        Args:
+            output: Caminho do arquivo ou arquivo já aberto para escrita.
+            every: Intervalo, em gerações, entre os registros.
+            buffer_size: Número de registros acumulados antes de cada escrita.
+        """
+        super().__init__(every)
+        self._owns_output = isinstance(output, str)
+        self.output = open(output, "a") if self._owns_output else output
+        self.buffer_size = buffer_size
+        self.buffer = []
+        self.started = time.perf_counter()
+
+    def _record(self, record):
+        self.buffer.append(json.dumps(record, separators=(",", ":")))
+        if len(self.buffer) >= self.buffer_size:
+            self.flush()
+
+    def generation(self, generation, fitness, conflicts, ga):
+        if generation % self.every == 0:
+            self._record({
+                "event": "generation",
+                "generation": generation,
+                "fitness": fitness,
+                "conflicts": conflicts,
+                "mutation_prob": ga.mutation_prob,
+                "elapsed": round(time.perf_counter() - self.started, 6),
+            })
+
+    def solution_found(self, generation, ga):
+        self._record({
+            "event": "solution",
+            "generation": generation,
+            "genes": list(ga.best_chromosome.genes),
+            "elapsed": round(time.perf_counter() - self.started, 6),
+        })
+
+    def flush(self):
+        """
+        Grava os registros acumulados.
+        """
+        if self.buffer:
+            self.output.write("\n".join(self.buffer) + "\n")
+            self.buffer = []
+        self.output.flush()
+
+    def close(self):
+        self.flush()
+        if self._owns_output:
+            self.output.close()
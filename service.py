@@ -0,0 +1,392 @@
+import argparse
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from cli import DEFAULT_GENERATIONS, run_instance
+from fitness_cache import LRUCache
+
+# Parâmetros aceitos em uma requisição, repassados a cli.run_instance, com o tipo, o valor
+# mínimo e o máximo aceitos (None quando não há limite) e se null é permitido
+REQUEST_PARAMETERS = {
+    "N": (int, 8, None, False),
+    "population_size": (int, 1, None, False),
+    "mutation_prob": (float, 0.0, 1.0, False),
+    "crossover_prob": (float, 0.0, 1.0, False),
+    "generations": (int, 1, None, False),
+    "elite_size": (int, 0, None, False),
+    "seed": (int, None, None, True),
+    "permutation": (bool, None, None, False),
+    "exact": (bool, None, None, False),
+    "local_search_rate": (float, 0.0, 1.0, False),
+    "local_search_elites": (bool, None, None, False),
+    "local_search_budget": (int, 1, None, False),
+    "max_time": (float, 0.0, None, True),
+    "reject_duplicates": (bool, None, None, False),
+    "restart_after": (int, 1, None, True),
+    "restart_fraction": (float, 0.0, 1.0, False),
+}
+# Maior tabuleiro aceito em requisições com exact
+MAX_EXACT_REQUEST_N = 100_000
+# Requisições com custo estimado (população x gerações x rainhas) até este valor são agrupadas em lotes
+SMALL_REQUEST_COST = 125 * 125 * 8
+# Tempo máximo, em segundos, que uma requisição HTTP espera pelo resultado
+REQUEST_TIMEOUT = 600.0
+
+def _warm_up():
+    """
+    Tarefa vazia usada para iniciar os processos do pool antes da primeira requisição.
+    """
+    return True
+
+def _solve_batch(jobs):
+    """
+    Executa um lote de requisições em um processo do pool.
+
+    Args:
+        jobs: Lista de dicionários de parâmetros de cli.run_instance.
+
+    Returns:
+        Lista de pares ("ok", registro) ou ("error", mensagem), na ordem dos jobs.
+    """
+    results = []
+    for job in jobs:
+        try:
+            results.append(("ok", run_instance(**job)))
+        except Exception as error:
+            results.append(("error", f"{type(error).__name__}: {error}"))
+    return results
+
+def request_cost(job):
+    """
+    Estima o custo de uma requisição pelo número de genes avaliados no pior caso.
+    """
+    queens = job["N"] if job.get("permutation") else 8
+    return job.get("population_size", 125) * job.get("generations", DEFAULT_GENERATIONS) * queens
+
+def check_parameter(name, value):
+    """
+    Verifica o tipo e o intervalo de um parâmetro de requisição (ver REQUEST_PARAMETERS).
+
+    Raises:
+        ValueError: Se o valor for inválido.
+    """
+    kind, minimum, maximum, nullable = REQUEST_PARAMETERS[name]
+    if value is None:
+        if nullable:
+            return
+        raise ValueError(f"O parâmetro {name} não pode ser nulo.")
+    # bool é subclasse de int no Python, mas true/false não são números válidos aqui
+    if kind is bool:
+        valid = isinstance(value, bool)
+    elif kind is int:
+        valid = isinstance(value, int) and not isinstance(value, bool)
+    else:
+        valid = isinstance(value, (int, float)) and not isinstance(value, bool)
+    if not valid:
+        raise ValueError(f"O parâmetro {name} deve ser do tipo {kind.__name__}.")
+    if minimum is not None and value < minimum:
+        raise ValueError(f"O parâmetro {name} deve ser pelo menos {minimum}.")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"O parâmetro {name} deve ser no máximo {maximum}.")
+
+def parse_request(payload):
+    """
+    Valida os parâmetros de uma requisição.
+
+    Args:
+        payload: Dicionário decodificado do corpo JSON.
+
+    Returns:
+        Dicionário de parâmetros de cli.run_instance.
+
+    Raises:
+        ValueError: Se houver parâmetros desconhecidos ou inválidos.
+    """
+    if not isinstance(payload, dict):
+        raise ValueError("Cada requisição deve ser um objeto JSON.")
+    unknown = set(payload) - set(REQUEST_PARAMETERS)
+    if unknown:
+        raise ValueError(f"Parâmetros desconhecidos: {', '.join(sorted(unknown))}")
+    job = dict(payload)
+    job.setdefault("N", 8)
+    for name, value in job.items():
+        check_parameter(name, value)
+    if job.get("exact") and job["N"] > MAX_EXACT_REQUEST_N:
+        raise ValueError(f"Com exact, o tamanho do tabuleiro deve ser no máximo {MAX_EXACT_REQUEST_N}.")
+    if job.get("elite_size", 5) > job.get("population_size", 125):
+        raise ValueError("O parâmetro elite_size não pode ser maior que population_size.")
+    return job
+
+def cache_key(job):
+    """
+    Returns:
+        Chave do cache de resultados, ou None se o resultado não for reprodutível
+        (sem semente ou com limite de tempo).
+    """
+    if job.get("seed") is None or job.get("max_time") is not None:
+        return None
+    return json.dumps(job, sort_keys=True)
+
+class SolveService:
+    def __init__(self, workers=None, batch_size=8, batch_window=0.005, cache_size=1024):
+        """
+        Serviço de resolução com um pool de processos mantido aquecido.
+
+        Requisições pequenas que chegam dentro de uma mesma janela são enviadas juntas a um
+        processo, e resultados de requisições reprodutíveis (com semente) ficam em um cache LRU.
+
+        Args:
+            workers: Número de processos do pool (padrão: número de CPUs).
+            batch_size: Número máximo de requisições por lote.
+            batch_window: Tempo, em segundos, que o primeiro pedido de um lote espera por outros.
+            cache_size: Número máximo de resultados guardados (0 desativa o cache).
+        """
+        self.workers = workers or os.cpu_count() or 1
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+        self.batch_size = batch_size
+        self.batch_window = batch_window
+        self.cache = LRUCache(cache_size) if cache_size else None
+        self._lock = threading.Lock()
+        self._pending = {}  # Requisições reprodutíveis em andamento, compartilhadas por chave
+        self._queue = queue.Queue()
+        self.started = time.monotonic()
+        self.requests = 0
+        self.batches = 0
+        self.batched_requests = 0
+        self.errors = 0
+
+        # Inicia todos os processos agora, para que a primeira requisição não pague a inicialização
+        for future in [self.executor.submit(_warm_up) for _ in range(self.workers)]:
+            future.result()
+        self._batcher = threading.Thread(target=self._batch_loop, daemon=True)
+        self._batcher.start()
+
+    def submit(self, job):
+        """
+        Agenda uma requisição.
+
+        Args:
+            job: Dicionário retornado por parse_request.
+
+        Returns:
+            Future cujo resultado é o dicionário de resposta, com "result" e "metrics".
+        """
+        received = time.monotonic()
+        key = cache_key(job)
+        small = request_cost(job) <= SMALL_REQUEST_COST
+        with self._lock:
+            self.requests += 1
+            if key is not None:
+                if self.cache is not None:
+                    record = self.cache.get(key)
+                    if record is not None:
+                        future = Future()
+                        future.set_result({"result": record, "metrics": {"cached": True, "latency": time.monotonic() - received}})
+                        return future
+                # Uma requisição idêntica já em execução é reaproveitada
+                pending = self._pending.get(key)
+                if pending is not None:
+                    return pending
+            future = Future()
+            if key is not None:
+                self._pending[key] = future
+
+        request = (job, key, future, received)
+        try:
+            if small:
+                self._queue.put(request)
+            else:
+                self._dispatch([request])
+        except Exception as error:
+            # Sem isso, requisições idênticas posteriores esperariam para sempre pela pendente
+            with self._lock:
+                if key is not None:
+                    self._pending.pop(key, None)
+                self.errors += 1
+            future.set_exception(error)
+        return future
+
+    def solve(self, job, timeout=None):
+        """
+        Resolve uma requisição, bloqueando até o resultado.
+
+        Returns:
+            Dicionário de resposta, com "result" e "metrics".
+        """
+        return self.submit(job).result(timeout)
+
+    def _batch_loop(self):
+        while True:
+            request = self._queue.get()
+            if request is None:
+                return
+            batch = [request]
+            deadline = time.monotonic() + self.batch_window
+            while len(batch) < self.batch_size:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    request = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if request is None:
+                    self._dispatch(batch)
+                    return
+                batch.append(request)
+            self._dispatch(batch)
+
+    def _dispatch(self, batch):
+        dispatched = time.monotonic()
+        with self._lock:
+            self.batches += 1
+            self.batched_requests += len(batch)
+        batch_future = self.executor.submit(_solve_batch, [job for job, _, _, _ in batch])
+        batch_future.add_done_callback(lambda f: self._finish(batch, f, dispatched))
+
+    def _finish(self, batch, batch_future, dispatched):
+        finished = time.monotonic()
+        try:
+            results = batch_future.result()
+        except Exception as error:
+            results = [("error", f"{type(error).__name__}: {error}")] * len(batch)
+        for (job, key, future, received), (status, value) in zip(batch, results):
+            with self._lock:
+                if key is not None:
+                    self._pending.pop(key, None)
+                if status == "ok" and key is not None and self.cache is not None:
+                    self.cache.put(key, value)
+                if status != "ok":
+                    self.errors += 1
+            if status == "ok":
+                future.set_result({
+                    "result": value,
+                    "metrics": {
+                        "cached": False,
+                        "batch_size": len(batch),
+                        "queue_time": dispatched - received,
+                        "latency": finished - received,
+                    },
+                })
+            else:
+                future.set_exception(RuntimeError(value))
+
+    def metrics(self):
+        """
+        Returns:
+            Dicionário com contadores de requisições, lotes e cache do serviço.
+        """
+        with self._lock:
+            return {
+                "uptime": time.monotonic() - self.started,
+                "workers": self.workers,
+                "requests": self.requests,
+                "errors": self.errors,
+                "batches": self.batches,
+                "mean_batch_size": self.batched_requests / self.batches if self.batches else 0.0,
+                "cache_entries": len(self.cache) if self.cache is not None else 0,
+                "cache_hit_rate": self.cache.hit_rate if self.cache is not None else 0.0,
+            }
+
+    def close(self):
+        """
+        Encerra o agrupador de lotes e o pool de processos.
+        """
+        self._queue.put(None)
+        self._batcher.join()
+        self.executor.shutdown()
+
+class SolveRequestHandler(BaseHTTPRequestHandler):
+    """
+    Rotas:
+        POST /solve: corpo com um objeto de parâmetros (ou uma lista deles); responde com
+            {"result": registro de cli.run_instance, "metrics": {...}} (ou uma lista).
+        GET /metrics: métricas do serviço.
+        GET /health: {"status": "ok"}.
+    """
+    service = None  # SolveService compartilhado, definido por make_server
+
+    def _send_json(self, status, payload):
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._send_json(200, {"status": "ok"})
+        elif self.path == "/metrics":
+            self._send_json(200, self.service.metrics())
+        else:
+            self._send_json(404, {"error": "Rota não encontrada."})
+
+    def do_POST(self):
+        if self.path != "/solve":
+            self._send_json(404, {"error": "Rota não encontrada."})
+            return
+        try:
+            payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+            many = isinstance(payload, list)
+            jobs = [parse_request(item) for item in (payload if many else [payload])]
+        except ValueError as error:
+            self._send_json(400, {"error": str(error)})
+            return
+
+        # Todas as requisições do corpo são agendadas antes de esperar, para entrarem no mesmo lote
+        futures = [self.service.submit(job) for job in jobs]
+        try:
+            responses = [future.result(REQUEST_TIMEOUT) for future in futures]
+        except Exception as error:
+            self._send_json(500, {"error": str(error) or type(error).__name__})
+            return
+        self._send_json(200, responses if many else responses[0])
+
+    def log_message(self, format, *args):
+        pass
+
+def make_server(host="127.0.0.1", port=8765, service=None):
+    """
+    Cria o servidor HTTP do serviço.
+
+    Args:
+        host: Endereço de escuta (padrão: apenas a máquina local).
+        port: Porta de escuta.
+        service: SolveService usado pelas requisições (padrão: um novo serviço).
+
+    Returns:
+        ThreadingHTTPServer pronto para serve_forever().
+    """
+    handler = type("BoundSolveRequestHandler", (SolveRequestHandler,), {"service": service or SolveService()})
+    return ThreadingHTTPServer((host, port), handler)
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Serviço HTTP/JSON local do Algoritmo Genético.")
+    parser.add_argument("--host", default="127.0.0.1", help="Endereço de escuta.")
+    parser.add_argument("--port", type=int, default=8765, help="Porta de escuta.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Número de processos (padrão: número de CPUs).")
+    parser.add_argument("--batch-size", type=int, default=8, help="Máximo de requisições pequenas por lote.")
+    parser.add_argument("--batch-window", type=float, default=0.005, help="Segundos de espera para formar um lote.")
+    parser.add_argument("--cache-size", type=int, default=1024, help="Resultados guardados em cache (0 desativa).")
+    return parser
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    service = SolveService(workers=args.workers, batch_size=args.batch_size, batch_window=args.batch_window, cache_size=args.cache_size)
+    server = make_server(args.host, args.port, service)
+    print(f"Servindo em http://{args.host}:{args.port} com {service.workers} processos")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        service.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+# Meta de tempo (em segundos) para a janela principal abrir, pela mediana das execuções
+STARTUP_TARGET = 1.0
+# Módulos do núcleo do algoritmo, que devem ser importáveis sem dependências da interface
+CORE_MODULES = ("genetic_algorithm", "permutation_algorithm", "checkpoint", "cli", "exact_solver")
+GUI_DEPENDENCIES = ("tkinter", "matplotlib", "numpy")
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+def measure(command, runs=5, env=None):
+    """
+    Mede o tempo de parede de um comando, executado várias vezes em processos novos.
+
+    Args:
+        command: Lista com o comando e seus argumentos.
+        runs: Número de execuções.
+        env: Variáveis de ambiente extras.
+
+    Returns:
+        Lista com o tempo, em segundos, de cada execução.
+    """
+    environment = dict(os.environ, **(env or {}))
+    times = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, cwd=HERE, env=environment, check=True, stdout=subprocess.DEVNULL)
+        times.append(time.perf_counter() - start)
+    return times
+
+def core_gui_dependencies():
+    """
+    Returns:
+        Lista das dependências de interface carregadas ao importar os módulos do núcleo.
+    """
+    code = (f"import sys\nimport {', '.join(CORE_MODULES)}\n"
+            f"print(' '.join(m for m in {GUI_DEPENDENCIES!r} if m in sys.modules))")
+    output = subprocess.run([sys.executable, "-c", code], cwd=HERE, check=True, capture_output=True, text=True).stdout
+    return output.split()
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Mede o tempo de inicialização da interface e do núcleo do algoritmo.")
+    parser.add_argument("--exe", default=None, help="Executável empacotado a medir (padrão: python main.py).")
+    parser.add_argument("-r", "--runs", type=int, default=5, help="Número de execuções de cada medida.")
+    parser.add_argument("--target", type=float, default=STARTUP_TARGET, help="Meta, em segundos, para a mediana da abertura da janela.")
+    parser.add_argument("--skip-gui", action="store_true", help="Mede apenas as importações (sem abrir a janela).")
+    return parser
+
+def report(name, times):
+    print(f"{name}: mediana {statistics.median(times):.3f}s, mínimo {min(times):.3f}s, máximo {max(times):.3f}s")
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    failed = False
+
+    loaded = core_gui_dependencies()
+    if loaded:
+        print(f"O núcleo do algoritmo carrega dependências de interface: {', '.join(loaded)}")
+        failed = True
+
+    report("Importação do núcleo", measure([sys.executable, "-c", f"import {', '.join(CORE_MODULES)}"], args.runs))
+    report("Importação da interface", measure([sys.executable, "-c", "import main"], args.runs))
+
+    if not args.skip_gui:
+        from main import EXIT_AFTER_STARTUP_ENV
+        command = [args.exe] if args.exe else [sys.executable, "main.py"]
+        times = measure(command, args.runs, env={EXIT_AFTER_STARTUP_ENV: "1"})
+        report("Abertura da janela", times)
+        if statistics.median(times) > args.target:
+            print(f"Meta de {args.target:.3f}s não atingida.")
+            failed = True
+
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
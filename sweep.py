@@ -0,0 +1,201 @@
+import argparse
+import itertools
+import json
+import math
+import random
+import statistics
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from cli import run_instance
+
+# Parâmetros do Algoritmo Genético ajustados pela busca
+PARAMETERS = ("population_size", "mutation_prob", "crossover_prob", "elite_size")
+
+def grid_configurations(grid):
+    """
+    Gera todas as combinações de uma grade de parâmetros.
+
+    Args:
+        grid: Dicionário parâmetro -> lista de valores.
+
+    Returns:
+        Lista de dicionários, um por configuração.
+    """
+    names = list(grid)
+    return [dict(zip(names, values)) for values in itertools.product(*(grid[name] for name in names))]
+
+def random_configurations(space, count, seed=None):
+    """
+    Sorteia configurações de um espaço de parâmetros.
+
+    Args:
+        space: Dicionário parâmetro -> lista de valores (sorteio entre eles) ou
+            tupla (mínimo, máximo) (sorteio uniforme; inteiro se os limites forem inteiros).
+        count: Número de configurações.
+        seed: Semente do sorteio.
+
+    Returns:
+        Lista de dicionários, um por configuração, sem repetições.
+    """
+    rng = random.Random(seed)
+    configurations = []
+    seen = set()
+    for _ in range(count * 10):
+        if len(configurations) == count:
+            break
+        config = {}
+        for name, values in space.items():
+            if isinstance(values, tuple):
+                low, high = values
+                config[name] = rng.randint(low, high) if isinstance(low, int) and isinstance(high, int) else rng.uniform(low, high)
+            else:
+                config[name] = rng.choice(values)
+        key = tuple(sorted(config.items()))
+        if key not in seen:
+            seen.add(key)
+            configurations.append(config)
+    return configurations
+
+def summarize(config, records):
+    """
+    Resume as execuções de uma configuração.
+
+    O tempo esperado por solução (tempo total / soluções) combina taxa de sucesso e
+    velocidade: é o tempo médio para obter uma solução reiniciando execuções que falham.
+
+    Args:
+        config: Parâmetros da configuração.
+        records: Registros retornados por cli.run_instance.
+
+    Returns:
+        Dicionário com as métricas da configuração.
+    """
+    solved = [r["wall_time"] for r in records if r["conflicts"] == 0]
+    total_time = sum(r["wall_time"] for r in records)
+    return {
+        "config": config,
+        "runs": len(records),
+        "successes": len(solved),
+        "success_rate": len(solved) / len(records) if records else 0.0,
+        "median_time_to_solution": statistics.median(solved) if solved else None,
+        "median_generations": statistics.median(r["generations"] for r in records) if records else None,
+        "expected_time_per_solution": total_time / len(solved) if solved else math.inf,
+    }
+
+def rank_key(report):
+    return (report["expected_time_per_solution"], -report["success_rate"])
+
+def successive_halving(configurations, N, generations=125, seeds_per_round=4, eta=2, max_rounds=None,
+                       workers=None, seed=0, permutation=False, log=None):
+    """
+    Avalia configurações por halving sucessivo: a cada rodada todas as configurações
+    restantes rodam com novas sementes e apenas a melhor fração 1/eta segue adiante,
+    com eta vezes mais sementes na rodada seguinte.
+
+    Todas as configurações de uma rodada usam as mesmas sementes, para uma comparação justa.
+
+    Args:
+        configurations: Lista de dicionários com os parâmetros de cada configuração.
+        N: Tamanho do tabuleiro (N x N).
+        generations: Número máximo de gerações de cada execução.
+        seeds_per_round: Sementes da primeira rodada.
+        eta: Fator de eliminação (e de aumento de sementes) por rodada.
+        max_rounds: Número máximo de rodadas (padrão: até restar uma configuração).
+        workers: Número de processos (padrão: número de CPUs).
+        seed: Semente base das execuções.
+        permutation: Se True, usa a codificação por permutação (N rainhas).
+        log: Arquivo onde o resumo de cada rodada é escrito (opcional).
+
+    Returns:
+        Lista de relatórios (ver summarize), do melhor para o pior. Configurações
+        eliminadas trazem o campo "eliminated_in_round".
+    """
+    results = {index: [] for index in range(len(configurations))}
+    alive = list(results)
+    eliminated = {}
+    next_seed = seed
+    seeds = seeds_per_round
+    round_number = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        while alive:
+            round_number += 1
+            round_seeds = list(range(next_seed, next_seed + seeds))
+            next_seed += seeds
+            jobs = [(index, s) for index in alive for s in round_seeds]
+            futures = [
+                executor.submit(run_instance, N=N, generations=generations, seed=s, permutation=permutation, **configurations[index])
+                for index, s in jobs
+            ]
+            for (index, _), future in zip(jobs, futures):
+                results[index].append(future.result())
+
+            ranked = sorted(alive, key=lambda i: rank_key(summarize(configurations[i], results[i])))
+            if log is not None:
+                best = summarize(configurations[ranked[0]], results[ranked[0]])
+                log.write(f"Rodada {round_number}: {len(alive)} configurações x {seeds} sementes; "
+                          f"melhor {best['config']} (sucesso {best['success_rate']:.0%})\n")
+                log.flush()
+            if len(alive) == 1 or (max_rounds and round_number >= max_rounds):
+                break
+            survivors = max(1, math.ceil(len(alive) / eta))
+            for index in ranked[survivors:]:
+                eliminated[index] = round_number
+            alive = ranked[:survivors]
+            seeds *= eta
+
+    reports = []
+    for index, config in enumerate(configurations):
+        report = summarize(config, results[index])
+        if index in eliminated:
+            report["eliminated_in_round"] = eliminated[index]
+        reports.append(report)
+    # Sobreviventes primeiro; entre eles (e entre os eliminados na mesma rodada), pelo tempo esperado
+    reports.sort(key=lambda r: (-r.get("eliminated_in_round", math.inf),) + rank_key(r))
+    return reports
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Busca de parâmetros do Algoritmo Genético com halving sucessivo.")
+    parser.add_argument("-n", "--board-size", type=int, default=8, help="Tamanho do tabuleiro NxN (mínimo 8).")
+    parser.add_argument("-g", "--generations", type=int, default=125, help="Máximo de iterações de cada execução.")
+    parser.add_argument("-p", "--population-size", type=int, nargs="+", default=[50, 125, 250], help="Valores de tamanho da população.")
+    parser.add_argument("-m", "--mutation-prob", type=float, nargs="+", default=[0.01, 0.05, 0.1], help="Valores de probabilidade de mutação.")
+    parser.add_argument("-c", "--crossover-prob", type=float, nargs="+", default=[0.5, 0.7, 0.9], help="Valores de probabilidade de crossover.")
+    parser.add_argument("-e", "--elite-size", type=int, nargs="+", default=[2, 5], help="Valores de elite size.")
+    parser.add_argument("--random", type=int, default=0, help="Sorteia esse número de configurações da grade em vez de usá-la inteira.")
+    parser.add_argument("--seeds", type=int, default=4, help="Sementes por configuração na primeira rodada.")
+    parser.add_argument("--eta", type=int, default=2, help="Fator de eliminação por rodada.")
+    parser.add_argument("--rounds", type=int, default=None, help="Número máximo de rodadas.")
+    parser.add_argument("-s", "--seed", type=int, default=0, help="Semente base.")
+    parser.add_argument("-w", "--workers", type=int, default=None, help="Número de processos (padrão: número de CPUs).")
+    parser.add_argument("--permutation", action="store_true", help="Usa a codificação por permutação (N rainhas).")
+    parser.add_argument("-o", "--output", default="-", help="Arquivo de saída JSON ('-' para a saída padrão).")
+    return parser
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.board_size < 8:
+        parser.error("O tamanho do tabuleiro deve ser pelo menos 8.")
+    if args.eta < 2 or args.seeds < 1:
+        parser.error("--eta deve ser pelo menos 2 e --seeds pelo menos 1.")
+
+    grid = {name: getattr(args, name) for name in PARAMETERS}
+    configurations = random_configurations(grid, args.random, args.seed) if args.random else grid_configurations(grid)
+    reports = successive_halving(
+        configurations, args.board_size, generations=args.generations, seeds_per_round=args.seeds,
+        eta=args.eta, max_rounds=args.rounds, workers=args.workers, seed=args.seed,
+        permutation=args.permutation, log=sys.stderr,
+    )
+
+    output = sys.stdout if args.output == "-" else open(args.output, "w")
+    try:
+        for report in reports:
+            report = dict(report, expected_time_per_solution=None if math.isinf(report["expected_time_per_solution"]) else report["expected_time_per_solution"])
+            output.write(json.dumps(report) + "\n")
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+if __name__ == "__main__":
+    main()
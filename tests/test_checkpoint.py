@@ -0,0 +1,48 @@
+import pytest
+from checkpoint import load_checkpoint, save_checkpoint
+from genetic_algorithm import GeneticAlgorithm
+from permutation_algorithm import PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+GENERATIONS = 40
+
+CASES = [
+    (GeneticAlgorithm, dict(N=20, queens=20, population_size=20), dict(restart_after=3)),
+    (PermutationGeneticAlgorithm, dict(N=200, population_size=6, crossover_method="pmx"), dict(restart_after=3)),
+    (GeneticAlgorithm, dict(N=30, queens=30, population_size=10), dict(local_search_rate=0.2, local_search_budget=2)),
+]
+
+@pytest.mark.parametrize("algorithm, params, options", CASES)
+def test_resume_matches_uninterrupted_run(tmp_path, algorithm, params, options):
+    path = str(tmp_path / "execucao.ckpt")
+
+    straight = algorithm(**params, **options, generations=GENERATIONS, seed=7, progress=SilentProgress())
+    expected = straight.run()
+
+    interrupted = algorithm(**params, **options, generations=GENERATIONS, seed=7, progress=SilentProgress())
+    interrupted.run(max_generations=GENERATIONS // 2)
+    save_checkpoint(interrupted, path)
+
+    resumed = load_checkpoint(path, progress=SilentProgress(), **options)
+    best = resumed.run()
+
+    assert resumed.generation == straight.generation
+    assert list(best.genes) == list(expected.genes)
+    assert best.conflicts == expected.conflicts
+    assert list(resumed.conflicts_history) == list(straight.conflicts_history)
+    assert resumed.restarts == straight.restarts
+    assert resumed.mutation_prob == straight.mutation_prob
+
+def test_restores_population_and_rng_state(tmp_path):
+    path = str(tmp_path / "execucao.ckpt")
+    ga = PermutationGeneticAlgorithm(N=30, population_size=6, generations=10, seed=3, progress=SilentProgress(), history_size=4)
+    ga.run(max_generations=5)
+    save_checkpoint(ga, path)
+
+    restored = load_checkpoint(path, progress=SilentProgress())
+
+    assert type(restored) is PermutationGeneticAlgorithm
+    assert [list(c.genes) for c in restored.population] == [list(c.genes) for c in ga.population]
+    assert [c.conflicts for c in restored.population] == [c.conflicts for c in ga.population]
+    assert restored.conflicts_history.maxlen == 4
+    assert restored.rng.getstate() == ga.rng.getstate()
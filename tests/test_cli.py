@@ -0,0 +1,39 @@
+import json
+from checkpoint import save_checkpoint
+from cli import main, run_instance
+from permutation_algorithm import PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+PARAMS = dict(N=200, population_size=6, mutation_prob=0.05, crossover_prob=0.7, elite_size=2, seed=7)
+
+def interrupted_checkpoint(path, generations, stop_at):
+    ga = PermutationGeneticAlgorithm(**PARAMS, generations=generations, progress=SilentProgress())
+    ga.run(max_generations=stop_at)
+    save_checkpoint(ga, path)
+
+def run_cli(argv, tmp_path):
+    output = tmp_path / "saida.jsonl"
+    main(argv + ["-o", str(output)])
+    return json.loads(output.read_text())
+
+def test_resume_keeps_stored_generation_limit_and_seed(tmp_path):
+    path = str(tmp_path / "execucao.ckpt")
+    interrupted_checkpoint(path, generations=60, stop_at=30)
+
+    record = run_cli(["--resume", path], tmp_path)
+    expected = run_instance(permutation=True, generations=60, **PARAMS)
+
+    assert record["seed"] == PARAMS["seed"]
+    assert record["generations"] == expected["generations"] > 30
+    assert record["genes"] == expected["genes"]
+    assert record["conflicts"] == expected["conflicts"]
+    assert record["stop_reason"] == expected["stop_reason"]
+
+def test_resume_with_generations_overrides_stored_limit(tmp_path):
+    path = str(tmp_path / "execucao.ckpt")
+    interrupted_checkpoint(path, generations=60, stop_at=30)
+
+    record = run_cli(["--resume", path, "-g", "45"], tmp_path)
+
+    assert record["generations"] == 45
+    assert record["stop_reason"] == "generations"
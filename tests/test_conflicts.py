@@ -0,0 +1,83 @@
+import random
+import pytest
+from genetic_algorithm import Chromosome, GeneticAlgorithm
+from permutation_algorithm import PermutationChromosome, PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+def brute_force_conflicts(genes):
+    """
+    Conta os pares de rainhas na mesma coluna ou diagonal comparando todos os pares.
+    """
+    genes = list(genes)
+    conflicts = 0
+    for i in range(len(genes)):
+        for j in range(i + 1, len(genes)):
+            if genes[i] == genes[j] or abs(genes[i] - genes[j]) == j - i:
+                conflicts += 1
+    return conflicts
+
+def assert_scored(chromosome):
+    expected = brute_force_conflicts(chromosome.genes)
+    assert chromosome.conflicts == expected
+    assert chromosome.fitness == 1 / (1 + expected)
+
+@pytest.mark.parametrize("N, queens", [(8, 8), (12, 8), (20, 20), (300, 8)])
+def test_classic_incremental_updates(N, queens):
+    rng = random.Random(N)
+    chromosome = Chromosome([rng.randrange(N) for _ in range(queens)], N)
+    assert_scored(chromosome)
+    for _ in range(500):
+        chromosome.set_gene(rng.randrange(queens), rng.randrange(N))
+        assert_scored(chromosome)
+    copy = chromosome.copy()
+    copy.set_gene(0, (copy.genes[0] + 1) % N)
+    assert_scored(copy)
+    assert_scored(chromosome)
+
+@pytest.mark.parametrize("N", [8, 31, 257])
+def test_permutation_incremental_updates(N):
+    rng = random.Random(N)
+    genes = list(range(N))
+    rng.shuffle(genes)
+    chromosome = PermutationChromosome(genes, N)
+    assert_scored(chromosome)
+    for _ in range(500):
+        chromosome.swap(rng.randrange(N), rng.randrange(N))
+        assert_scored(chromosome)
+
+@pytest.mark.parametrize("chromosome_class, N", [(Chromosome, 10), (PermutationChromosome, 10)])
+def test_known_conflicts_build_counters_lazily(chromosome_class, N):
+    rng = random.Random(1)
+    genes = list(range(N))
+    rng.shuffle(genes)
+    scored = chromosome_class(genes, N)
+    lazy = chromosome_class(list(genes), N, conflicts=scored.conflicts)
+    for _ in range(100):
+        if chromosome_class is Chromosome:
+            lazy.set_gene(rng.randrange(N), rng.randrange(N))
+        else:
+            lazy.swap(rng.randrange(N), rng.randrange(N))
+        assert_scored(lazy)
+
+OPTIONS = [
+    dict(),
+    dict(fitness_cache_size=64),
+    dict(local_search_rate=0.3, local_search_elites=True, local_search_budget=50),
+    dict(reject_duplicates=True, restart_after=2, restart_fraction=0.5),
+    dict(fitness_cache_size=16, local_search_rate=0.5, reject_duplicates=True, restart_after=3),
+]
+
+@pytest.mark.parametrize("options", OPTIONS)
+@pytest.mark.parametrize("algorithm, params", [
+    (GeneticAlgorithm, dict(N=10, queens=8, population_size=30)),
+    (GeneticAlgorithm, dict(N=24, queens=24, population_size=12)),
+    (PermutationGeneticAlgorithm, dict(N=40, population_size=10)),
+    (PermutationGeneticAlgorithm, dict(N=40, population_size=10, crossover_method="pmx")),
+])
+def test_population_scores_match_brute_force(algorithm, params, options):
+    ga = algorithm(**params, **options, generations=30, seed=5, progress=SilentProgress())
+    for snapshot in ga.iter_run():
+        for chromosome in ga.population:
+            assert_scored(chromosome)
+        assert_scored(ga.best_chromosome)
+        assert snapshot.conflicts == ga.best_chromosome.conflicts
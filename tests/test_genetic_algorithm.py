@@ -0,0 +1,20 @@
+import pytest
+from genetic_algorithm import GeneticAlgorithm
+from permutation_algorithm import PermutationGeneticAlgorithm
+from progress import SilentProgress
+
+@pytest.mark.parametrize("algorithm, params", [
+    (GeneticAlgorithm, dict(N=8, queens=1)),
+    (GeneticAlgorithm, dict(N=1, queens=1)),
+    (PermutationGeneticAlgorithm, dict(N=1)),
+])
+@pytest.mark.parametrize("options", [dict(), dict(reject_duplicates=True, local_search_rate=1.0)])
+def test_single_row_boards(algorithm, params, options):
+    ga = algorithm(**params, **options, population_size=6, elite_size=1, crossover_prob=1.0, mutation_prob=1.0,
+                   generations=5, seed=1, progress=SilentProgress())
+    best = ga.run()
+    assert best.conflicts == 0
+    for chromosome in ga.population:
+        ga.perturb(chromosome)
+        ga.mutate(chromosome)
+        assert chromosome.conflicts == 0
@@ -0,0 +1,29 @@
+import pytest
+from island_model import IslandModel, migration_targets
+
+def test_migration_targets():
+    assert migration_targets(3, 4, "ring") == [0]
+    assert migration_targets(1, 3, "fully_connected") == [0, 2]
+    assert migration_targets(0, 1, "ring") == []
+
+@pytest.mark.parametrize("options", [
+    dict(islands=0),
+    dict(migration_interval=0),
+    dict(migration_size=0),
+    dict(topology="star"),
+])
+def test_rejects_invalid_configuration(options):
+    with pytest.raises(ValueError):
+        IslandModel(8, **options)
+
+def test_run_returns_best_island():
+    model = IslandModel(8, islands=2, population_size=100, generations=200, seed=1)
+    best = model.run()
+    assert len(model.island_results) == 2
+    assert best.conflicts == min(result["conflicts"] for result in model.island_results)
+
+def test_crashed_island_raises_instead_of_hanging():
+    # Um tabuleiro vazio faz o Algoritmo Genético de cada ilha falhar ao sortear a população
+    model = IslandModel(0, islands=2, population_size=20, generations=5)
+    with pytest.raises(RuntimeError, match="sem publicar"):
+        model.run()